@@ -41,7 +41,11 @@ from dbslice.output.csv_out import CSVGenerator
 from dbslice.output.json_out import JSONGenerator
 from dbslice.output.sql import SQLGenerator
 from dbslice.utils.connection import parse_database_url
-from dbslice.utils.fileio import write_text_file_secure
+from dbslice.utils.fileio import (
+    open_text_file_secure,
+    write_text_file_secure,
+    write_text_files_secure,
+)
 
 logger = get_logger(__name__)
 
@@ -580,43 +584,51 @@ def _generate_and_output_json(
         mode = json_mode
 
     generator = JSONGenerator(mode=mode, pretty=json_pretty)
+
+    if out_file and mode == "single":
+        # Stream straight into the file instead of building the whole document
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        with open_text_file_secure(out_file, file_mode=output_file_mode, encoding="utf-8") as f:
+            generator.generate_to_stream(
+                f,
+                result.tables,
+                result.insert_order,
+                schema.tables,
+                result.broken_fks,
+                result.deferred_updates,
+                row_counts=result.stats,
+            )
+        if not no_progress:
+            console.print()
+            console.print(
+                f"[green]Wrote {result.total_rows()} rows to [bold]{out_file}[/bold][/green]"
+            )
+        return [out_file.resolve()]
+
     json_output = generator.generate(
         result.tables,
         result.insert_order,
         schema.tables,
         result.broken_fks,
         result.deferred_updates,
+        row_counts=result.stats,
     )
 
     if out_file:
-        if mode == "single":
-            assert isinstance(json_output, str)
-            out_file.parent.mkdir(parents=True, exist_ok=True)
-            write_text_file_secure(
-                out_file, json_output, file_mode=output_file_mode, encoding="utf-8"
+        assert isinstance(json_output, dict)
+        out_file.mkdir(parents=True, exist_ok=True)
+        table_files = {
+            out_file / f"{table_name}.json": table_json
+            for table_name, table_json in json_output.items()
+        }
+        write_text_files_secure(table_files, file_mode=output_file_mode, encoding="utf-8")
+        written_files = [table_file.resolve() for table_file in table_files]
+        if not no_progress:
+            console.print()
+            console.print(
+                f"[green]Wrote {result.table_count()} tables ({result.total_rows()} rows) to [bold]{out_file}[/bold][/green]"
             )
-            if not no_progress:
-                console.print()
-                console.print(
-                    f"[green]Wrote {result.total_rows()} rows to [bold]{out_file}[/bold][/green]"
-                )
-            return [out_file.resolve()]
-        else:
-            assert isinstance(json_output, dict)
-            out_file.mkdir(parents=True, exist_ok=True)
-            written_files: list[Path] = []
-            for table_name, table_json in json_output.items():
-                table_file = out_file / f"{table_name}.json"
-                write_text_file_secure(
-                    table_file, table_json, file_mode=output_file_mode, encoding="utf-8"
-                )
-                written_files.append(table_file.resolve())
-            if not no_progress:
-                console.print()
-                console.print(
-                    f"[green]Wrote {result.table_count()} tables ({result.total_rows()} rows) to [bold]{out_file}[/bold][/green]"
-                )
-            return written_files
+        return written_files
     else:
         # Output to stdout (only single mode makes sense)
         if mode == "per-table":
@@ -630,6 +642,7 @@ def _generate_and_output_json(
                 schema.tables,
                 result.broken_fks,
                 result.deferred_updates,
+                row_counts=result.stats,
             )
 
         if not no_progress:
@@ -696,13 +709,12 @@ def _generate_and_output_csv(
         else:
             assert isinstance(csv_output, dict)
             out_file.mkdir(parents=True, exist_ok=True)
-            written_files: list[Path] = []
-            for table_name, table_csv in csv_output.items():
-                table_file = out_file / f"{table_name}.csv"
-                write_text_file_secure(
-                    table_file, table_csv, file_mode=output_file_mode, encoding="utf-8"
-                )
-                written_files.append(table_file.resolve())
+            table_files = {
+                out_file / f"{table_name}.csv": table_csv
+                for table_name, table_csv in csv_output.items()
+            }
+            write_text_files_secure(table_files, file_mode=output_file_mode, encoding="utf-8")
+            written_files = [table_file.resolve() for table_file in table_files]
             if not no_progress:
                 console.print()
                 console.print(
@@ -22,6 +22,12 @@ MAX_AVAILABLE_COLUMNS_DISPLAY = 10
 DEFAULT_ANONYMIZATION_SEED = "dbslice_default_seed"
 """Default seed value for deterministic anonymization."""
 
+DEFAULT_ANONYMIZATION_CACHE_SIZE = 100_000
+"""Maximum number of anonymized values kept per (column, provider) anonymizer LRU cache."""
+
+DEFAULT_PARALLEL_ANONYMIZATION_CHUNK_SIZE = 10_000
+"""Rows per worker task when anonymizing a table across processes."""
+
 DEFAULT_STREAMING_THRESHOLD = 50000
 """Auto-enable streaming mode above this row count."""
 
@@ -30,3 +36,9 @@ DEFAULT_STREAMING_CHUNK_SIZE = 1000
 
 DEFAULT_OUTPUT_FILE_MODE = 0o600
 """Secure default permissions for newly created output files."""
+
+OUTPUT_FILE_BUFFER_SIZE = 1 << 20
+"""Write buffer size (bytes) for output files; fewer write syscalls on large exports."""
+
+MAX_PARALLEL_FILE_WRITES = 8
+"""Maximum number of threads used to write per-table output files."""
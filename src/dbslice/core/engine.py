@@ -566,7 +566,7 @@ class ExtractionEngine:
         if not self.anonymizer:
             return rows
 
-        return [self.anonymizer.anonymize_row(table, row) for row in rows]
+        return self.anonymizer.anonymize_rows(table, rows)
 
     def _run_pii_scan(
         self,
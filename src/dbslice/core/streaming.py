@@ -242,7 +242,7 @@ class StreamingExtractionEngine:
             ):
                 # Anonymize chunk if needed
                 if self.anonymizer:
-                    chunk = [self.anonymizer.anonymize_row(table, row) for row in chunk]
+                    chunk = self.anonymizer.anonymize_rows(table, chunk)
 
                 for row in chunk:
                     insert_stmt = self.sql_generator._generate_insert(
@@ -183,6 +183,10 @@ class ContextLogger:
         extra = {"context": merged_context} if merged_context else {}
         self._logger.log(level, msg, extra=extra, exc_info=exc_info)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at this level would be logged."""
+        return self._logger.isEnabledFor(level)
+
     def debug(self, msg: str, **context):
         """Log DEBUG level message with optional context."""
         self._log(logging.DEBUG, msg, context)
@@ -253,14 +257,13 @@ def log_extraction_start(logger: ContextLogger, database_url: str, seeds: list):
     from dbslice.utils.connection import parse_database_url
 
     config = parse_database_url(database_url)
-    masked_url = database_url.replace(config.password, "***") if config.password else database_url
 
     logger.info(
         "Starting extraction",
         database=config.database,
         db_type=config.db_type.value,
         seed_count=len(seeds),
-        url=masked_url,
+        url=config.masked_url,
     )
 
 
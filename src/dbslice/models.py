@@ -67,6 +67,7 @@ class VirtualForeignKey:
     target_columns: tuple[str, ...]
     description: str
     is_nullable: bool = True  # Virtual FKs are often nullable
+    _foreign_key: ForeignKey | None = field(default=None, init=False, repr=False, compare=False)
 
     def __hash__(self) -> int:
         """Hash for use in sets and as dict keys."""
@@ -82,16 +83,25 @@ class VirtualForeignKey:
         return self.source_table == self.target_table
 
     def to_foreign_key(self) -> ForeignKey:
-        """Convert to a regular ForeignKey for compatibility."""
-        return ForeignKey(
-            name=self.name,
-            source_table=self.source_table,
-            source_columns=self.source_columns,
-            target_table=self.target_table,
-            target_columns=self.target_columns,
-            is_nullable=self.is_nullable,
-            is_deferrable=False,
-        )
+        """Convert to a regular ForeignKey for compatibility.
+
+        The result is built once and cached on the instance, since graph
+        traversal converts the same virtual FK on every parent/child lookup.
+        """
+        fk = self._foreign_key
+        if fk is None:
+            fk = ForeignKey(
+                name=self.name,
+                source_table=self.source_table,
+                source_columns=self.source_columns,
+                target_table=self.target_table,
+                target_columns=self.target_columns,
+                is_nullable=self.is_nullable,
+                is_deferrable=False,
+            )
+            # Frozen dataclass: bypass __setattr__ to populate the cache
+            object.__setattr__(self, "_foreign_key", fk)
+        return fk
 
 
 @dataclass
@@ -1,15 +1,56 @@
 import csv
 import io
 import json
+from collections.abc import Callable, Iterator
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
 from dbslice.constants import DEFAULT_OUTPUT_FILE_MODE
 from dbslice.models import Table
-from dbslice.utils.fileio import write_text_file_secure
+from dbslice.utils.fileio import (
+    COMPRESSION_EXTENSIONS,
+    write_text_file_secure,
+    write_text_files_secure,
+)
+
+_TRUE = "true"
+_FALSE = "false"
+_EMPTY = ""
+
+
+@lru_cache(maxsize=4096)
+def _format_int(value: int) -> str:
+    """
+    Format an int, reusing strings for repeated values (ids, enums, flags).
+
+    Only exact ints are routed here: equal Decimals and floats can render
+    differently (Decimal("1.0") vs Decimal("1.00"), 0.0 vs -0.0), so caching
+    them would change output.
+    """
+    return str(value)
+
+
+# Formatters for the common exact cell types, looked up by type(value) so typical
+# cells skip the isinstance ladder in CSVGenerator._format_value. Subclasses and
+# types needing generator settings (dict/list) fall through to the ladder.
+_EXACT_TYPE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: _format_int,
+    float: str,
+    Decimal: str,
+    UUID: str,
+    bool: lambda value: _TRUE if value else _FALSE,
+    type(None): lambda value: _EMPTY,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    timedelta: lambda value: str(value.total_seconds()),
+    bytes: bytes.hex,
+}
 
 
 class CSVGenerator:
@@ -34,6 +75,8 @@ class CSVGenerator:
         delimiter: str = ",",
         quoting: int = csv.QUOTE_MINIMAL,
         line_terminator: str = "\n",
+        ascii_safe: bool = False,
+        compression: str | None = None,
     ):
         """
         Initialize CSV generator with output configuration.
@@ -43,17 +86,27 @@ class CSVGenerator:
             delimiter: Field delimiter (default: comma)
             quoting: CSV quoting style from csv module constants
             line_terminator: Line ending (default: "\n")
+            ascii_safe: Escape non-ASCII characters in JSON-encoded dict/list cells
+            compression: Compress files written by write_to_file ("gzip" or "zstd").
+                Per-table files get a .gz/.zst suffix; zstd needs the zstandard package
 
         Raises:
-            ValueError: If mode is not "single" or "per-table"
+            ValueError: If mode is not "single" or "per-table", or compression is unknown
         """
         if mode not in ("single", "per-table"):
             raise ValueError(f"Invalid mode: {mode}. Must be 'single' or 'per-table'")
+        if compression is not None and compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(
+                f"Invalid compression: {compression}. Must be one of: "
+                f"{', '.join(COMPRESSION_EXTENSIONS)}"
+            )
 
         self.mode = mode
         self.delimiter = delimiter
         self.quoting = quoting
         self.line_terminator = line_terminator
+        self.ascii_safe = ascii_safe
+        self.compression = compression
 
     def generate(
         self,
@@ -103,7 +156,8 @@ class CSVGenerator:
         Generate single CSV file with all tables.
 
         Format includes a table_name column as the first column to identify
-        which table each row belongs to:
+        which table each row belongs to, followed by the union of all table
+        columns in first-seen order (tables taken in insert_order):
 
         table_name,column1,column2,...
         users,1,alice@example.com,...
@@ -120,13 +174,15 @@ class CSVGenerator:
         output = io.StringIO()
         writer = None
 
-        all_columns: set[str] = set()
-        for table_name, rows in tables_data.items():
-            if rows:
-                all_columns.update(rows[0].keys())
-
-        sorted_columns = sorted(all_columns)
-        fieldnames = ["table_name"] + sorted_columns
+        # Columns in first-seen order following insert_order, so each table's
+        # columns keep their natural (SELECT) order instead of being alphabetized
+        columns = dict.fromkeys(
+            col
+            for table_name in insert_order
+            if tables_data.get(table_name)
+            for col in tables_data[table_name][0]
+        )
+        fieldnames = ["table_name", *columns]
 
         for table_name in insert_order:
             if table_name not in tables_data:
@@ -137,24 +193,18 @@ class CSVGenerator:
                 continue
 
             if writer is None:
+                # restval fills columns that this table's rows do not have
                 writer = csv.DictWriter(
                     output,
                     fieldnames=fieldnames,
+                    restval="",
                     delimiter=self.delimiter,
                     quoting=self.quoting,  # type: ignore[arg-type]
                     lineterminator=self.line_terminator,
                 )
                 writer.writeheader()
 
-            for row in rows:
-                csv_row = {"table_name": table_name}
-                for col, value in row.items():
-                    csv_row[col] = self._format_value(value)
-                # Fill missing columns with empty string
-                for col in sorted_columns:
-                    if col not in csv_row:
-                        csv_row[col] = ""
-                writer.writerow(csv_row)
+            writer.writerows(self._single_mode_rows(table_name, rows))
 
         return output.getvalue()
 
@@ -190,23 +240,73 @@ class CSVGenerator:
 
             fieldnames = list(rows[0].keys())
 
-            writer = csv.DictWriter(
+            writer = csv.writer(
                 output,
-                fieldnames=fieldnames,
                 delimiter=self.delimiter,
                 quoting=self.quoting,  # type: ignore[arg-type]
                 lineterminator=self.line_terminator,
             )
-            writer.writeheader()
-
-            for row in rows:
-                csv_row = {col: self._format_value(value) for col, value in row.items()}
-                writer.writerow(csv_row)
+            writer.writerow(fieldnames)
+            # writerows drives the row iterator from C instead of a Python loop
+            writer.writerows(self._per_table_rows(rows, fieldnames))
 
             result[table_name] = output.getvalue()
 
         return result
 
+    def _per_table_rows(
+        self,
+        rows: list[dict[str, Any]],
+        fieldnames: list[str],
+    ) -> Iterator[tuple[str, ...]]:
+        """
+        Yield formatted per-table CSV rows in header order.
+
+        Matches csv.DictWriter: columns missing from a row are written as empty
+        strings, and columns not in the header raise ValueError.
+
+        Args:
+            rows: Row dicts for the table
+            fieldnames: Header columns, taken from the first row
+
+        Yields:
+            Formatted cell values, one tuple per row
+        """
+        fmt = self._format_value
+        header = set(fieldnames)
+        for row in rows:
+            if row.keys() == header:
+                yield tuple(fmt(row[col]) for col in fieldnames)
+                continue
+            extra = [col for col in row if col not in header]
+            if extra:
+                raise ValueError(
+                    "dict contains fields not in fieldnames: " + ", ".join(map(repr, extra))
+                )
+            yield tuple(fmt(row[col]) if col in row else "" for col in fieldnames)
+
+    def _single_mode_rows(
+        self,
+        table_name: str,
+        rows: list[dict[str, Any]],
+    ) -> Iterator[dict[str, str]]:
+        """
+        Yield formatted single-mode CSV rows for one table.
+
+        Args:
+            table_name: Table the rows belong to
+            rows: Row dicts for the table
+
+        Yields:
+            Row dicts keyed by output column, tagged with table_name
+        """
+        fmt = self._format_value
+        for row in rows:
+            csv_row = {"table_name": table_name}
+            for col, value in row.items():
+                csv_row[col] = fmt(value)
+            yield csv_row
+
     def _format_value(self, value: Any) -> str:
         """
         Format a Python value as CSV field value.
@@ -230,13 +330,17 @@ class CSVGenerator:
         Returns:
             String representation suitable for CSV
         """
+        formatter = _EXACT_TYPE_FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+
         if value is None:
             # CSV convention: NULL is represented as empty field
-            return ""
+            return _EMPTY
 
         if isinstance(value, bool):
             # Use lowercase for consistency with JSON
-            return "true" if value else "false"
+            return _TRUE if value else _FALSE
 
         if isinstance(value, datetime):
             return value.isoformat()
@@ -258,7 +362,7 @@ class CSVGenerator:
             return value.hex()
 
         if isinstance(value, dict | list):
-            return json.dumps(value, default=str, ensure_ascii=False)
+            return json.dumps(value, default=str, ensure_ascii=self.ascii_safe)
 
         if isinstance(value, Decimal | int | float):
             return str(value)
@@ -289,16 +393,29 @@ class CSVGenerator:
                 raise ValueError("Single mode output must be a string")
 
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            write_text_file_secure(file_path, output, file_mode=file_mode, encoding="utf-8")
+            write_text_file_secure(
+                file_path,
+                output,
+                file_mode=file_mode,
+                encoding="utf-8",
+                compression=self.compression,
+            )
         else:
             if not isinstance(output, dict):
                 raise ValueError("Per-table mode output must be a dict")
 
             file_path.mkdir(parents=True, exist_ok=True)
-
-            for table_name, csv_str in output.items():
-                table_file = file_path / f"{table_name}.csv"
-                write_text_file_secure(table_file, csv_str, file_mode=file_mode, encoding="utf-8")
+            suffix = COMPRESSION_EXTENSIONS[self.compression] if self.compression else ""
+
+            write_text_files_secure(
+                {
+                    file_path / f"{table_name}.csv{suffix}": csv_str
+                    for table_name, csv_str in output.items()
+                },
+                file_mode=file_mode,
+                encoding="utf-8",
+                compression=self.compression,
+            )
 
 
 def generate_csv(
@@ -1,18 +1,26 @@
+import io
 import json
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 from uuid import UUID
 
 from dbslice.constants import DEFAULT_OUTPUT_FILE_MODE
 from dbslice.models import Table
-from dbslice.utils.fileio import write_text_file_secure
+from dbslice.utils.fileio import (
+    COMPRESSION_EXTENSIONS,
+    write_text_file_secure,
+    write_text_files_secure,
+)
 
 
-class DatabaseTypeEncoder(json.JSONEncoder):
+def _encode_db_type(obj: Any) -> Any:
     """
-    Custom JSON encoder that handles database-specific types.
+    Convert database-specific types to JSON-compatible values.
+
+    Used as the ``default`` hook for ``json.dumps`` so that native types stay on
+    the C-accelerated encoder and only unsupported values reach Python.
 
     Supported type conversions:
     - datetime -> ISO 8601 string with timezone
@@ -22,43 +30,53 @@ class DatabaseTypeEncoder(json.JSONEncoder):
     - Decimal -> float
     - UUID -> string
     - bytes -> hex string
-    - Any other non-serializable type -> string representation
+
+    Args:
+        obj: Object to convert
+
+    Returns:
+        JSON-serializable representation of the object
+
+    Raises:
+        TypeError: If the object type is not supported
     """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
 
-    def default(self, obj: Any) -> Any:
-        """
-        Convert non-serializable objects to JSON-compatible types.
+    if isinstance(obj, date):
+        return obj.isoformat()
 
-        Args:
-            obj: Object to convert
+    if isinstance(obj, time):
+        return obj.isoformat()
 
-        Returns:
-            JSON-serializable representation of the object
-        """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
+    if isinstance(obj, timedelta):
+        # Convert to total seconds for easy reconstruction
+        return obj.total_seconds()
 
-        if isinstance(obj, date):
-            return obj.isoformat()
+    if isinstance(obj, Decimal):
+        # Convert to float for JSON compatibility
+        return float(obj)
 
-        if isinstance(obj, time):
-            return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
 
-        if isinstance(obj, timedelta):
-            # Convert to total seconds for easy reconstruction
-            return obj.total_seconds()
+    if isinstance(obj, bytes):
+        return obj.hex()
 
-        if isinstance(obj, Decimal):
-            # Convert to float for JSON compatibility
-            return float(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
-        if isinstance(obj, UUID):
-            return str(obj)
 
-        if isinstance(obj, bytes):
-            return obj.hex()
+class DatabaseTypeEncoder(json.JSONEncoder):
+    """
+    JSON encoder that handles database-specific types.
+
+    Kept for callers using ``cls=DatabaseTypeEncoder``; conversion is delegated
+    to the same hook JSONGenerator passes as ``default``.
+    """
 
-        return super().default(obj)
+    def default(self, obj: Any) -> Any:
+        """Convert non-serializable objects to JSON-compatible types."""
+        return _encode_db_type(obj)
 
 
 class JSONGenerator:
@@ -81,6 +99,8 @@ class JSONGenerator:
         mode: str = "single",
         pretty: bool = True,
         indent: int = 2,
+        ascii_safe: bool = False,
+        compression: str | None = None,
     ):
         """
         Initialize JSON generator with output configuration.
@@ -89,16 +109,27 @@ class JSONGenerator:
             mode: Output mode - "single" or "per-table"
             pretty: Enable pretty-printing with indentation
             indent: Number of spaces for indentation (if pretty=True)
+            ascii_safe: Escape non-ASCII characters (ensure_ascii=True). Useful when
+                the data is known to be ASCII or consumers require ASCII-only output
+            compression: Compress files written by write_to_file ("gzip" or "zstd").
+                Per-table files get a .gz/.zst suffix; zstd needs the zstandard package
 
         Raises:
-            ValueError: If mode is not "single" or "per-table"
+            ValueError: If mode is not "single" or "per-table", or compression is unknown
         """
         if mode not in ("single", "per-table"):
             raise ValueError(f"Invalid mode: {mode}. Must be 'single' or 'per-table'")
+        if compression is not None and compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(
+                f"Invalid compression: {compression}. Must be one of: "
+                f"{', '.join(COMPRESSION_EXTENSIONS)}"
+            )
 
         self.mode = mode
         self.pretty = pretty
         self.indent = indent if pretty else None
+        self.ascii_safe = ascii_safe
+        self.compression = compression
 
     def generate(
         self,
@@ -107,6 +138,7 @@ class JSONGenerator:
         tables_schema: dict[str, Table],
         broken_fks: list[Any] | None = None,
         deferred_updates: list[Any] | None = None,
+        row_counts: dict[str, int] | None = None,
     ) -> str | dict[str, str]:
         """
         Generate JSON output from extracted data.
@@ -117,6 +149,8 @@ class JSONGenerator:
             tables_schema: Dict mapping table name to Table schema
             broken_fks: List of ForeignKey objects that were broken (for cycles)
             deferred_updates: List of DeferredUpdate objects (for cycles)
+            row_counts: Optional per-table row counts already known to the caller
+                (e.g. ExtractionResult.stats); avoids recounting for metadata
 
         Returns:
             In "single" mode: JSON string with all data
@@ -132,6 +166,7 @@ class JSONGenerator:
                 tables_schema,
                 broken_fks,
                 deferred_updates,
+                row_counts,
             )
         else:
             return self._generate_per_table(
@@ -147,6 +182,7 @@ class JSONGenerator:
         tables_schema: dict[str, Table],
         broken_fks: list[Any],
         deferred_updates: list[Any],
+        row_counts: dict[str, int] | None = None,
     ) -> str:
         """
         Generate single JSON file with all tables and metadata.
@@ -173,11 +209,83 @@ class JSONGenerator:
             tables_schema: Table schemas (not included in output)
             broken_fks: Broken foreign keys for cycle handling
             deferred_updates: Deferred updates for cycle handling
+            row_counts: Precomputed per-table row counts, if available
 
         Returns:
             JSON string with all data and metadata
         """
-        total_rows = sum(len(rows) for rows in tables_data.values())
+        output = io.StringIO()
+        self._write_single(
+            output,
+            tables_data,
+            insert_order,
+            broken_fks,
+            deferred_updates,
+            row_counts,
+        )
+        return output.getvalue()
+
+    def generate_to_stream(
+        self,
+        out: TextIO,
+        tables_data: dict[str, list[dict[str, Any]]],
+        insert_order: list[str],
+        tables_schema: dict[str, Table],
+        broken_fks: list[Any] | None = None,
+        deferred_updates: list[Any] | None = None,
+        row_counts: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Write single-mode JSON output directly to a text stream.
+
+        Produces the same document as generate() in single mode, but serializes
+        one table at a time so the full output is never held in memory as one
+        string.
+
+        Args:
+            out: Writable text stream (e.g. an open output file)
+            tables_data: Dict mapping table name to list of row dicts
+            insert_order: Tables in topologically sorted order
+            tables_schema: Dict mapping table name to Table schema
+            broken_fks: List of ForeignKey objects that were broken (for cycles)
+            deferred_updates: List of DeferredUpdate objects (for cycles)
+            row_counts: Optional per-table row counts already known to the caller
+
+        Raises:
+            ValueError: If the generator is in per-table mode
+        """
+        if self.mode != "single":
+            raise ValueError("Streaming output is only supported in single mode")
+
+        self._write_single(
+            out,
+            tables_data,
+            insert_order,
+            broken_fks or [],
+            deferred_updates or [],
+            row_counts,
+        )
+
+    def _write_single(
+        self,
+        out: TextIO,
+        tables_data: dict[str, list[dict[str, Any]]],
+        insert_order: list[str],
+        broken_fks: list[Any],
+        deferred_updates: list[Any],
+        row_counts: dict[str, int] | None,
+    ) -> None:
+        """
+        Write the single-mode document to a stream, table by table.
+
+        Each table is encoded on its own and spliced into the document with the
+        same separators and indentation json.dumps would use for the whole
+        structure, so the output is byte-for-byte identical.
+        """
+        if row_counts is not None:
+            total_rows = sum(row_counts.values())
+        else:
+            total_rows = sum(len(rows) for rows in tables_data.values())
         has_cycles = len(broken_fks) > 0 or len(deferred_updates) > 0
 
         metadata: dict[str, Any] = {
@@ -192,17 +300,39 @@ class JSONGenerator:
             metadata["broken_fks_count"] = len(broken_fks)
             metadata["deferred_updates_count"] = len(deferred_updates)
 
-        output: dict[str, Any] = {
-            "metadata": metadata,
-            "tables": tables_data,
-        }
+        def dumps(obj: Any, level: int) -> str:
+            encoded = json.dumps(
+                obj,
+                default=_encode_db_type,
+                indent=self.indent,
+                ensure_ascii=self.ascii_safe,
+            )
+            if self.indent is None or level == 0:
+                return encoded
+            # Literal newlines only appear between tokens (JSON escapes them in
+            # strings), so re-indenting a nested value is a plain replace.
+            return encoded.replace("\n", newline(level))
 
-        return json.dumps(
-            output,
-            cls=DatabaseTypeEncoder,
-            indent=self.indent,
-            ensure_ascii=False,
-        )
+        def newline(level: int) -> str:
+            if self.indent is None:
+                return ""
+            return "\n" + " " * (self.indent * level)
+
+        item_separator = ", " if self.indent is None else ","
+
+        out.write("{" + newline(1) + '"metadata": ' + dumps(metadata, 1))
+        out.write(item_separator + newline(1) + '"tables": ')
+
+        if not tables_data:
+            out.write("{}" + newline(0) + "}")
+            return
+
+        out.write("{")
+        for i, (table_name, rows) in enumerate(tables_data.items()):
+            if i:
+                out.write(item_separator)
+            out.write(newline(2) + dumps(table_name, 2) + ": " + dumps(rows, 2))
+        out.write(newline(1) + "}" + newline(0) + "}")
 
     def _generate_per_table(
         self,
@@ -239,9 +369,9 @@ class JSONGenerator:
 
             result[table_name] = json.dumps(
                 table_output,
-                cls=DatabaseTypeEncoder,
+                default=_encode_db_type,
                 indent=self.indent,
-                ensure_ascii=False,
+                ensure_ascii=self.ascii_safe,
             )
 
         return result
@@ -270,16 +400,29 @@ class JSONGenerator:
                 raise ValueError("Single mode output must be a string")
 
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            write_text_file_secure(file_path, output, file_mode=file_mode, encoding="utf-8")
+            write_text_file_secure(
+                file_path,
+                output,
+                file_mode=file_mode,
+                encoding="utf-8",
+                compression=self.compression,
+            )
         else:
             if not isinstance(output, dict):
                 raise ValueError("Per-table mode output must be a dict")
 
             file_path.mkdir(parents=True, exist_ok=True)
-
-            for table_name, json_str in output.items():
-                table_file = file_path / f"{table_name}.json"
-                write_text_file_secure(table_file, json_str, file_mode=file_mode, encoding="utf-8")
+            suffix = COMPRESSION_EXTENSIONS[self.compression] if self.compression else ""
+
+            write_text_files_secure(
+                {
+                    file_path / f"{table_name}.json{suffix}": json_str
+                    for table_name, json_str in output.items()
+                },
+                file_mode=file_mode,
+                encoding="utf-8",
+                compression=self.compression,
+            )
 
 
 def generate_json(
@@ -1,9 +1,17 @@
 import hashlib
 import secrets
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from fnmatch import fnmatchcase
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from dbslice.constants import DEFAULT_ANONYMIZATION_SEED
+from dbslice.constants import (
+    DEFAULT_ANONYMIZATION_CACHE_SIZE,
+    DEFAULT_ANONYMIZATION_SEED,
+    DEFAULT_PARALLEL_ANONYMIZATION_CHUNK_SIZE,
+)
 from dbslice.logging import get_logger
 
 logger = get_logger(__name__)
@@ -119,6 +127,36 @@ _SECURITY_NULL_PATTERNS: list[str] = [
     "oauth_secret",
 ]
 
+# Per-column anonymization decision: (action, faker_method, custom_transformer, value_cache).
+# action is "keep" (FK or non-sensitive), "null" (security-sensitive) or "mask";
+# value_cache is the (column, faker_method) cache shard for deterministic Faker masking.
+_ColumnPolicy = tuple[str, str | None, Callable[[Any], Any] | None, "OrderedDict[str, Any] | None"]
+
+_NO_COLUMNS: frozenset[str] = frozenset()
+
+# Size of Faker's default random_int() range (0..9999), used by the random_int fast path
+_RANDOM_INT_RANGE = 10_000
+
+
+@lru_cache(maxsize=4096)
+def _builtin_faker_method(col_lower: str) -> str | None:
+    """
+    Return the built-in Faker method for a lowercased column name, if any.
+
+    The first pattern (in declaration order) contained in the name wins. Column
+    names repeat for every row, so results are cached per distinct name.
+    """
+    for pattern, method in _DEFAULT_ANONYMIZATION_PATTERNS.items():
+        if pattern in col_lower:
+            return method
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _matches_security_null_pattern(col_lower: str) -> bool:
+    """Check whether a lowercased column name contains a security-null pattern."""
+    return any(pattern in col_lower for pattern in _SECURITY_NULL_PATTERNS)
+
 
 class DeterministicAnonymizer:
     """
@@ -134,6 +172,7 @@ class DeterministicAnonymizer:
         schema: "SchemaGraph | None" = None,
         deterministic: bool = True,
         manifest: "ComplianceManifest | None" = None,
+        cache_size: int = DEFAULT_ANONYMIZATION_CACHE_SIZE,
     ):
         """
         Initialize the anonymizer with a global seed.
@@ -143,6 +182,8 @@ class DeterministicAnonymizer:
             schema: Optional schema graph for FK detection (prevents anonymizing FK columns)
             deterministic: If False, use random seeds per value (stronger privacy, no cross-table consistency)
             manifest: Optional compliance manifest to record anonymization actions
+            cache_size: Maximum number of anonymized values to cache per (column, provider)
+                (least recently used entries are evicted; evicted values regenerate identically)
 
         Raises:
             ImportError: If Faker is not installed
@@ -155,16 +196,22 @@ class DeterministicAnonymizer:
         mode = "deterministic" if deterministic else "non-deterministic"
         logger.info("Initializing anonymizer", seed=seed[:20] + "...", mode=mode)
         self.global_seed = seed
+        # BLAKE2b keys are limited to 64 bytes, so key with a digest of the seed
+        self._seed_key = hashlib.blake2b(seed.encode()).digest()
         self.deterministic = deterministic
         self.fake = Faker()
-        self._cache: dict[tuple, Any] = {}
+        # LRU value caches sharded by (column, faker_method), keyed by str(value)
+        self._cache: dict[tuple[str, str], OrderedDict[str, Any]] = {}
+        self.cache_size = cache_size
         self.redact_fields: set[str] = set()  # Set of normalized "table.column"
         self.field_providers: dict[str, str] = {}
         self.custom_patterns: list[tuple[str, str]] = []
         self.fallback_patterns: list[tuple[str, str]] = []
         self.security_null_fields: list[str] = []
+        self._column_policies: dict[tuple[str, str], _ColumnPolicy] = {}
+        self._fk_columns: dict[str, frozenset[str]] = {}  # FK source columns per table
         self.schema = schema
-        self._fk_columns_cache: dict[str, set[str]] = {}  # Cache of FK columns per table
+        self._seed_hashers: dict[tuple[str, str], Any] = {}
         self.manifest = manifest
         self._manifest_recorded: set[tuple[str, str]] = set()  # Track which fields we've recorded
 
@@ -173,8 +220,13 @@ class DeterministicAnonymizer:
         return f"{table}.{column}".lower()
 
     def _match_glob(self, pattern: str, field: str) -> bool:
-        """Case-insensitive shell-style glob match for table.column patterns."""
-        return fnmatchcase(field, pattern.lower())
+        """
+        Case-insensitive shell-style glob match for table.column patterns.
+
+        Both sides are already lowercase (configure() stores patterns lowered and
+        _normalize_field lowers the field), so neither is lowered again per match.
+        """
+        return fnmatchcase(field, pattern)
 
     def _resolve_pattern_provider(
         self, table: str, column: str, patterns: list[tuple[str, str]]
@@ -186,7 +238,10 @@ class DeterministicAnonymizer:
         - Most specific pattern wins (longest non-wildcard literal).
         - Ties are resolved by declaration order (first wins).
         """
-        field = self._normalize_field(table, column)
+        return self._match_pattern_provider(self._normalize_field(table, column), patterns)
+
+    def _match_pattern_provider(self, field: str, patterns: list[tuple[str, str]]) -> str | None:
+        """Resolve provider from wildcard patterns for an already normalized field."""
         best_provider: str | None = None
         best_specificity = -1
 
@@ -222,19 +277,29 @@ class DeterministicAnonymizer:
         4. Built-in column substring mapping
         5. pystr fallback
         """
-        exact_provider = self._resolve_exact_field_provider(table, column)
-        if exact_provider:
-            return exact_provider
+        field = self._normalize_field(table, column)
+        return self._match_field_provider(field, column.lower()) or "pystr"
 
-        pattern_provider = self._resolve_custom_pattern_provider(table, column)
-        if pattern_provider:
-            return pattern_provider
+    def _match_field_provider(self, field: str, col_lower: str) -> str | None:
+        """
+        Resolve the configured or built-in provider for a column, if any.
 
-        fallback_pattern_provider = self._resolve_fallback_pattern_provider(table, column)
-        if fallback_pattern_provider:
-            return fallback_pattern_provider
+        Takes the normalized "table.column" and lowercased column name so callers
+        resolving several rules for one column compute them only once.
+        """
+        return (
+            self.field_providers.get(field)
+            or self._match_pattern_provider(field, self.custom_patterns)
+            or self._match_pattern_provider(field, self.fallback_patterns)
+            or _builtin_faker_method(col_lower)
+        )
 
-        return self.get_faker_method(column)
+    def _match_security_null(self, field: str, col_lower: str) -> bool:
+        """Check security-null globs and built-in patterns for a normalized column."""
+        for pattern in self.security_null_fields:
+            if self._match_glob(pattern, field):
+                return True
+        return _matches_security_null_pattern(col_lower)
 
     def configure(
         self,
@@ -265,6 +330,7 @@ class DeterministicAnonymizer:
             (pattern.lower(), provider) for pattern, provider in (fallback_patterns or {}).items()
         ]
         self.security_null_fields = [pattern.lower() for pattern in (security_null_fields or [])]
+        self._column_policies.clear()
 
         logger.info(
             "Anonymizer configured",
@@ -275,6 +341,24 @@ class DeterministicAnonymizer:
             security_null_pattern_count=len(self.security_null_fields),
         )
 
+    @property
+    def schema(self) -> "SchemaGraph | None":
+        """Schema graph used for FK detection."""
+        return self._schema
+
+    @schema.setter
+    def schema(self, schema: "SchemaGraph | None") -> None:
+        """Set the schema and rebuild the FK column map for every table up front."""
+        self._schema = schema
+        fk_columns: dict[str, set[str]] = {}
+        if schema is not None:
+            for fk in schema.edges:
+                fk_columns.setdefault(fk.source_table, set()).update(fk.source_columns)
+            for vfk in schema.virtual_edges:
+                fk_columns.setdefault(vfk.source_table, set()).update(vfk.source_columns)
+        self._fk_columns = {table: frozenset(columns) for table, columns in fk_columns.items()}
+        self._column_policies.clear()
+
     def _is_foreign_key_column(self, table: str, column: str) -> bool:
         """
         Check if a column is part of a foreign key.
@@ -289,16 +373,7 @@ class DeterministicAnonymizer:
         Returns:
             True if column is part of a foreign key
         """
-        if not self.schema:
-            return False
-
-        if table not in self._fk_columns_cache:
-            fk_columns: set[str] = set()
-            for _, fk in self.schema.get_parents(table):
-                fk_columns.update(fk.source_columns)
-            self._fk_columns_cache[table] = fk_columns
-
-        return column in self._fk_columns_cache[table]
+        return column in self._fk_columns.get(table, _NO_COLUMNS)
 
     def should_anonymize(self, table: str, column: str) -> bool:
         """
@@ -338,12 +413,7 @@ class DeterministicAnonymizer:
             return True
 
         # Pattern matching on column name
-        col_lower = column.lower()
-        for pattern in _DEFAULT_ANONYMIZATION_PATTERNS:
-            if pattern in col_lower:
-                return True
-
-        return False
+        return _builtin_faker_method(column.lower()) is not None
 
     def should_null(self, table: str, column: str) -> bool:
         """
@@ -360,16 +430,7 @@ class DeterministicAnonymizer:
         if self._is_foreign_key_column(table, column):
             return False
 
-        field = self._normalize_field(table, column)
-        for pattern in self.security_null_fields:
-            if self._match_glob(pattern, field):
-                return True
-
-        col_lower = column.lower()
-        for pattern in _SECURITY_NULL_PATTERNS:
-            if pattern in col_lower:
-                return True
-        return False
+        return self._match_security_null(self._normalize_field(table, column), column.lower())
 
     def get_faker_method(self, column: str) -> str:
         """
@@ -381,12 +442,8 @@ class DeterministicAnonymizer:
         Returns:
             Faker method name (e.g., "email", "phone_number")
         """
-        col_lower = column.lower()
-        for pattern, method in _DEFAULT_ANONYMIZATION_PATTERNS.items():
-            if pattern in col_lower:
-                return method
         # Default to random string
-        return "pystr"
+        return _builtin_faker_method(column.lower()) or "pystr"
 
     def anonymize_value(self, value: Any, table: str, column: str) -> Any:
         """
@@ -397,13 +454,14 @@ class DeterministicAnonymizer:
         in-memory cache keyed by (value, column) to ensure consistency.
 
         Cache Behavior:
-            - Cache key: (str(value), column, resolved_faker_method)
+            - Cache: one LRU per (column, resolved_faker_method), keyed by str(value)
             - Same value in same column type gets identical output across tables
             - Example: "john@example.com" in any "email" column → same fake email
             - This preserves referential integrity when values appear multiple times
 
         Determinism:
-            - Uses SHA-256 hash of (global_seed:column:method:value) as Faker seed
+            - Uses a BLAKE2b hash of (column:method:value), keyed by the global seed,
+              as the Faker seed
             - Column name is included to differentiate same values in different contexts
             - Example: "john" as first_name vs last_name may produce different outputs
 
@@ -418,44 +476,145 @@ class DeterministicAnonymizer:
         if value is None:
             return None
 
+        policy = self._get_column_policy(table, column)
+        if policy[0] == "keep":
+            return value
+        return self._apply_policy(policy, value, column)
+
+    def _apply_policy(self, policy: _ColumnPolicy, value: Any, column: str) -> Any:
+        """Apply a "null" or "mask" column policy to a non-NULL value."""
+        action, faker_method, custom_fn, value_cache = policy
+        if action == "null":
+            return None
+
+        # Custom compliance transformers take the original value as input
+        if custom_fn is not None:
+            return custom_fn(value)
+
+        assert faker_method is not None
+        return self._generate_fake(value, column, faker_method, value_cache)
+
+    def _get_column_policy(self, table: str, column: str) -> _ColumnPolicy:
+        """
+        Get the cached anonymization decision for a column.
+
+        The decision depends only on (table, column) and configuration, so it is
+        resolved once and reused for every row instead of re-running the FK,
+        NULL and pattern checks per value.
+        """
+        key = (table, column)
+        policy = self._column_policies.get(key)
+        if policy is None:
+            policy = self._resolve_column_policy(table, column)
+            self._column_policies[key] = policy
+        return policy
+
+    def _resolve_column_policy(self, table: str, column: str) -> _ColumnPolicy:
+        """Resolve (and record in the manifest) the anonymization decision for a column."""
         # FK integrity has highest priority over nulling/anonymization rules.
         if self._is_foreign_key_column(table, column):
             self._record_manifest_fk(table, column)
-            return value
+            return ("keep", None, None, None)
+
+        # Normalize once and run each rule set once: should_null/should_anonymize/
+        # _resolve_faker_method would each re-lower the name and re-match the globs.
+        field = self._normalize_field(table, column)
+        col_lower = column.lower()
 
-        if self.should_null(table, column):
+        if self._match_security_null(field, col_lower):
             self._record_manifest_null(table, column)
-            return None
+            return ("null", None, None, None)
 
-        if not self.should_anonymize(table, column):
-            self._record_manifest_unmasked(table, column)
-            return value
+        faker_method = self._match_field_provider(field, col_lower)
+        if faker_method is None:
+            # Explicit redaction (or a blank exact provider) still masks, as pystr
+            if field not in self.redact_fields and field not in self.field_providers:
+                self._record_manifest_unmasked(table, column)
+                return ("keep", None, None, None)
+            faker_method = "pystr"
 
-        faker_method = self._resolve_faker_method(table, column)
         self._record_manifest_masked(table, column, faker_method)
-
-        # Check for custom compliance transformers first (these take the value as input)
         custom_fn = self._get_custom_transformer(faker_method)
-        if custom_fn is not None:
-            return custom_fn(value)
+        value_cache = (
+            self._value_cache(column, faker_method)
+            if self.deterministic and custom_fn is None
+            else None
+        )
+        return ("mask", faker_method, custom_fn, value_cache)
+
+    def _value_cache(self, column: str, faker_method: str) -> "OrderedDict[str, Any]":
+        """
+        Get the LRU cache shard for anonymized values of one (column, faker_method).
+
+        Policies hold a reference to their shard, so a per-cell lookup hashes only
+        str(value) instead of a (value, column, method) tuple.
+        """
+        key = (column, faker_method)
+        value_cache = self._cache.get(key)
+        if value_cache is None:
+            value_cache = self._cache[key] = OrderedDict()
+        return value_cache
+
+    def _seeded_hasher(self, column: str, faker_method: str) -> Any:
+        """
+        Get a seed-keyed BLAKE2b hasher already fed with the "column:method:" prefix.
+
+        Keyed BLAKE2b folds the global seed in without rehashing it per value,
+        and callers copy() the hasher and add the value, so the prefix is also
+        hashed once per column.
+        """
+        key = (column, faker_method)
+        hasher = self._seed_hashers.get(key)
+        if hasher is None:
+            hasher = hashlib.blake2b(
+                f"{column}:{faker_method}:".encode(), key=self._seed_key, digest_size=8
+            )
+            self._seed_hashers[key] = hasher
+        return hasher
+
+    def _value_seed(self, value: Any, column: str, faker_method: str) -> int:
+        """
+        Derive the deterministic seed for one value.
 
+        Hashes global seed + column/provider + original value; including the column
+        means the same value in different column types gets different output.
+        """
+        hasher = self._seeded_hasher(column, faker_method).copy()
+        hasher.update(f"{value}".encode())
+        return int.from_bytes(hasher.digest(), "big")
+
+    def _generate_fake(
+        self,
+        value: Any,
+        column: str,
+        faker_method: str,
+        value_cache: "OrderedDict[str, Any] | None" = None,
+    ) -> Any:
+        """Generate the fake replacement for a value using the given Faker method."""
         if self.deterministic:
-            cache_key = (str(value), column, faker_method)
-            if cache_key in self._cache:
-                return self._cache[cache_key]
-
-            # Generate deterministic seed from global seed + column/provider + original value
-            # Including column name ensures same value in different column types gets different output
-            hash_input = f"{self.global_seed}:{column}:{faker_method}:{value}".encode()
-            seed_int = int.from_bytes(hashlib.sha256(hash_input).digest()[:8], "big")
-            self.fake.seed_instance(seed_int)
+            if faker_method == "random_int":
+                # Numeric columns (salary, wage, ...): take random_int()'s default range
+                # straight from the keyed hash instead of reseeding Faker, which is
+                # cheaper than caching the result
+                return self._value_seed(value, column, faker_method) % _RANDOM_INT_RANGE
+
+            if value_cache is None:
+                value_cache = self._value_cache(column, faker_method)
+            cache_key = str(value)
+            if cache_key in value_cache:
+                value_cache.move_to_end(cache_key)
+                return value_cache[cache_key]
+
+            self.fake.seed_instance(self._value_seed(value, column, faker_method))
 
             try:
                 anonymized = getattr(self.fake, faker_method)()
             except (AttributeError, TypeError):
                 anonymized = self.fake.pystr()
 
-            self._cache[cache_key] = anonymized
+            value_cache[cache_key] = anonymized
+            if len(value_cache) > self.cache_size:
+                value_cache.popitem(last=False)
             return anonymized
         else:
             seed_int = int.from_bytes(secrets.token_bytes(8), "big")
@@ -480,13 +639,17 @@ class DeterministicAnonymizer:
             New dictionary with sensitive fields anonymized
         """
         anonymized_count = 0
-        result = {}
+        result = dict(row)
 
         for column, value in row.items():
-            anonymized_value = self.anonymize_value(value, table, column)
-            if anonymized_value != value:
+            if value is None:
+                continue
+            # Count by the column's policy rather than comparing old and new
+            # values, which costs O(len) per cell for long strings/bytes
+            policy = self._get_column_policy(table, column)
+            if policy[0] != "keep":
+                result[column] = self._apply_policy(policy, value, column)
                 anonymized_count += 1
-            result[column] = anonymized_value
 
         if anonymized_count > 0:
             logger.debug(
@@ -498,6 +661,100 @@ class DeterministicAnonymizer:
 
         return result
 
+    def anonymize_rows(self, table: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Anonymize all sensitive fields in a batch of rows from one table.
+
+        Column policies are resolved once for the batch, and only the columns
+        that change are written over a copy of each row.
+
+        Args:
+            table: Table name
+            rows: List of row dictionaries
+
+        Returns:
+            New list of row dictionaries with sensitive fields anonymized
+        """
+        policies: dict[str, _ColumnPolicy] = {}
+        anonymized_fields = 0
+        result = []
+
+        for row in rows:
+            overrides: dict[str, Any] = {}
+            for column, value in row.items():
+                if value is None:
+                    continue
+                policy = policies.get(column)
+                if policy is None:
+                    policy = policies[column] = self._get_column_policy(table, column)
+                if policy[0] != "keep":
+                    overrides[column] = self._apply_policy(policy, value, column)
+            anonymized_fields += len(overrides)
+            result.append({**row, **overrides})
+
+        if anonymized_fields > 0:
+            logger.debug(
+                "Anonymized rows",
+                table=table,
+                row_count=len(rows),
+                anonymized_fields=anonymized_fields,
+            )
+
+        return result
+
+    def anonymize_rows_parallel(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_PARALLEL_ANONYMIZATION_CHUNK_SIZE,
+        workers: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Anonymize a batch of rows from one table across worker processes.
+
+        Column policies are resolved (and recorded in the manifest) here, then
+        shipped once to each worker, which anonymizes chunks of rows with its
+        own caches. Output is identical to anonymize_rows() because fake values
+        depend only on the seed, column, provider and original value.
+
+        Args:
+            table: Table name
+            rows: List of row dictionaries
+            chunk_size: Rows per task sent to a worker
+            workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            New list of row dictionaries with sensitive fields anonymized
+        """
+        if workers == 1 or len(rows) <= chunk_size:
+            return self.anonymize_rows(table, rows)
+
+        columns = dict.fromkeys(column for row in rows for column in row)
+        # Value caches stay worker-local, so strip the parent's shard references
+        policies: dict[str, _ColumnPolicy] = {
+            column: (*self._get_column_policy(table, column)[:3], None) for column in columns
+        }
+        if all(policy[0] == "keep" for policy in policies.values()):
+            return self.anonymize_rows(table, rows)
+
+        chunks = [rows[start : start + chunk_size] for start in range(0, len(rows), chunk_size)]
+        result: list[dict[str, Any]] = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_anonymize_worker,
+            initargs=(self.global_seed, self.deterministic, self.cache_size, table, policies),
+        ) as pool:
+            for anonymized_chunk in pool.map(_anonymize_chunk, chunks):
+                result.extend(anonymized_chunk)
+
+        logger.debug(
+            "Anonymized rows in parallel",
+            table=table,
+            row_count=len(rows),
+            chunk_count=len(chunks),
+        )
+        return result
+
     def get_statistics(self) -> dict[str, int]:
         """
         Get anonymization statistics.
@@ -506,7 +763,7 @@ class DeterministicAnonymizer:
             Dictionary with cache size and other stats
         """
         return {
-            "cache_size": len(self._cache),
+            "cache_size": sum(map(len, self._cache.values())),
             "redact_fields_count": len(self.redact_fields),
             "exact_provider_count": len(self.field_providers),
             "pattern_count": len(self.custom_patterns),
@@ -556,3 +813,41 @@ class DeterministicAnonymizer:
         if key not in self._manifest_recorded:
             self._manifest_recorded.add(key)
             self.manifest.record_unmasked_field(table, column)
+
+
+# Per-process state for anonymize_rows_parallel workers: (anonymizer, table)
+_worker_state: tuple[DeterministicAnonymizer, str] | None = None
+
+
+def _init_anonymize_worker(
+    seed: str,
+    deterministic: bool,
+    cache_size: int,
+    table: str,
+    policies: dict[str, _ColumnPolicy],
+) -> None:
+    """Build a worker-local anonymizer preloaded with the parent's column policies."""
+    global _worker_state
+    anonymizer = DeterministicAnonymizer(
+        seed=seed, deterministic=deterministic, cache_size=cache_size
+    )
+    for column, (action, faker_method, custom_fn, _) in policies.items():
+        value_cache = (
+            anonymizer._value_cache(column, faker_method)
+            if action == "mask" and faker_method and deterministic and custom_fn is None
+            else None
+        )
+        anonymizer._column_policies[(table, column)] = (
+            action,
+            faker_method,
+            custom_fn,
+            value_cache,
+        )
+    _worker_state = (anonymizer, table)
+
+
+def _anonymize_chunk(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Anonymize one chunk of rows in a worker process."""
+    assert _worker_state is not None
+    anonymizer, table = _worker_state
+    return anonymizer.anonymize_rows(table, rows)
@@ -1,7 +1,15 @@
+import gzip
+import io
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TextIO
+from typing import Any, BinaryIO, TextIO
+
+from dbslice.constants import MAX_PARALLEL_FILE_WRITES, OUTPUT_FILE_BUFFER_SIZE
+
+COMPRESSION_EXTENSIONS: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+"""File suffix appended for each supported output compression."""
 
 
 def parse_file_mode(mode: int | str) -> int:
@@ -24,17 +32,58 @@ def parse_file_mode(mode: int | str) -> int:
     return parsed
 
 
+class _ClosingGzipFile(gzip.GzipFile):
+    """Write-mode GzipFile that also closes the file object it writes into."""
+
+    def __init__(self, fileobj: BinaryIO, compresslevel: int) -> None:
+        super().__init__(fileobj=fileobj, mode="wb", compresslevel=compresslevel)
+        self._owned_fileobj = fileobj
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._owned_fileobj.close()
+
+
+def _import_zstandard() -> Any:
+    """Import the optional zstandard package, with an install hint if missing."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard is required for zstd compression. Install it with: pip install zstandard"
+        ) from e
+    return zstandard
+
+
 def open_text_file_secure(
     path: str | Path,
     file_mode: int,
     encoding: str = "utf-8",
+    compression: str | None = None,
 ) -> TextIO:
     """
     Open a text file for writing with explicit permissions.
 
     Uses os.open/os.fdopen so the requested mode is applied on creation,
     and reapplied to existing files for deterministic hardening behavior.
+    Files are opened with a large write buffer (OUTPUT_FILE_BUFFER_SIZE) since
+    output is typically written as many chunks or a few multi-MB strings.
+
+    With compression ("gzip" or "zstd"), text is encoded and compressed on
+    write. Fast compression levels are used since output is usually I/O bound.
     """
+    if compression is not None and compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(
+            f"Invalid compression: {compression}. Must be one of: "
+            f"{', '.join(COMPRESSION_EXTENSIONS)}"
+        )
+
+    # Resolve the optional compressor before touching the file, so a missing
+    # extra never truncates existing output.
+    zstandard = _import_zstandard() if compression == "zstd" else None
+
     flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
     fd = os.open(Path(path), flags, file_mode)
     try:
@@ -44,7 +93,17 @@ def open_text_file_secure(
         # Keep best effort behavior on platforms that may not support fchmod.
         pass
 
-    return os.fdopen(fd, "w", encoding=encoding)
+    if compression is None:
+        return os.fdopen(fd, "w", buffering=OUTPUT_FILE_BUFFER_SIZE, encoding=encoding)
+
+    # Compress into the already-opened descriptor rather than reopening the
+    # path, which could be swapped for a symlink in between.
+    raw = os.fdopen(fd, "wb", buffering=OUTPUT_FILE_BUFFER_SIZE)
+    if zstandard is None:
+        return io.TextIOWrapper(_ClosingGzipFile(raw, compresslevel=1), encoding=encoding)
+    return io.TextIOWrapper(
+        zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=True), encoding=encoding
+    )
 
 
 def write_text_file_secure(
@@ -52,7 +111,36 @@ def write_text_file_secure(
     content: str,
     file_mode: int,
     encoding: str = "utf-8",
+    compression: str | None = None,
 ) -> None:
-    """Write text to a file with explicit permissions."""
-    with open_text_file_secure(path, file_mode=file_mode, encoding=encoding) as f:
+    """Write text to a file with explicit permissions, optionally compressed."""
+    with open_text_file_secure(
+        path, file_mode=file_mode, encoding=encoding, compression=compression
+    ) as f:
         f.write(content)
+
+
+def write_text_files_secure(
+    files: dict[Path, str],
+    file_mode: int,
+    encoding: str = "utf-8",
+    compression: str | None = None,
+) -> None:
+    """
+    Write several text files with explicit permissions.
+
+    File writes release the GIL, so a small thread pool overlaps the open/write/
+    close latency of many per-table files. Raises the first error encountered.
+    """
+    if len(files) <= 1:
+        for path, content in files.items():
+            write_text_file_secure(path, content, file_mode, encoding, compression)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_FILE_WRITES, len(files))) as pool:
+        futures = [
+            pool.submit(write_text_file_secure, path, content, file_mode, encoding, compression)
+            for path, content in files.items()
+        ]
+        for future in futures:
+            future.result()
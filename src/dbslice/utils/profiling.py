@@ -1,10 +1,25 @@
+import heapq
 import time
-from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any
 
+_duration_ms = attrgetter("duration_ms")
 
-@dataclass
+# Methods replaced by no-ops on the instance while profiling is disabled
+_PROFILING_METHODS = ("start_query", "end_query", "track_query")
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for start_query/end_query while profiling is disabled."""
+
+
+def _track_disabled(*args: Any, **kwargs: Any) -> "QueryTracker":
+    """Stand-in for track_query while profiling is disabled."""
+    return _DISABLED_TRACKER
+
+
+@dataclass(slots=True)
 class QueryStats:
     """Statistics for a single database query."""
 
@@ -45,9 +60,34 @@ class QueryProfiler:
 
     def __init__(self):
         self.queries: list[QueryStats] = []
-        self._current_query: dict[str, Any] | None = None
-        self._start_time: float = 0.0
-        self.enabled = True
+        # In-flight query; plain attributes avoid building a dict per query
+        self._current_query: str | None = None
+        self._current_params_count = 0
+        self._current_table: str | None = None
+        self._current_operation: str | None = None
+        self._start_time_ns: int = 0
+        self._enabled: bool = True
+
+    @property
+    def enabled(self) -> bool:
+        """Whether queries are being tracked."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        """
+        Turn tracking on or off.
+
+        Disabling shadows start_query/end_query/track_query on the instance with
+        no-ops, so callers pay neither the enabled check nor the clock read per query.
+        """
+        self._enabled = enabled
+        instance_attrs = vars(self)
+        for name in _PROFILING_METHODS:
+            if enabled:
+                instance_attrs.pop(name, None)
+            else:
+                instance_attrs[name] = _track_disabled if name == "track_query" else _noop
 
     def start_query(
         self,
@@ -57,33 +97,27 @@ class QueryProfiler:
         operation: str | None = None,
     ) -> None:
         """Start tracking a new query."""
-        if not self.enabled:
-            return
-
-        self._start_time = time.perf_counter()
-        self._current_query = {
-            "query": query,
-            "params_count": params_count,
-            "table": table,
-            "operation": operation,
-            "rows_returned": 0,
-        }
+        self._start_time_ns = time.perf_counter_ns()
+        self._current_query = query
+        self._current_params_count = params_count
+        self._current_table = table
+        self._current_operation = operation
 
     def end_query(self, rows_returned: int = 0) -> None:
         """End tracking the current query."""
-        if not self.enabled or self._current_query is None:
+        if self._current_query is None:
             return
 
-        duration_ms = (time.perf_counter() - self._start_time) * 1000
-        self._current_query["rows_returned"] = rows_returned
+        # Integer nanoseconds keep full clock precision for sub-millisecond queries
+        duration_ms = (time.perf_counter_ns() - self._start_time_ns) / 1_000_000
 
         stats = QueryStats(
-            query=self._current_query["query"],
-            params_count=self._current_query["params_count"],
+            query=self._current_query,
+            params_count=self._current_params_count,
             duration_ms=duration_ms,
             rows_returned=rows_returned,
-            table=self._current_query["table"],
-            operation=self._current_query["operation"],
+            table=self._current_table,
+            operation=self._current_operation,
         )
         self.queries.append(stats)
         self._current_query = None
@@ -154,40 +188,86 @@ class QueryTracker:
         self.rows_returned = count
 
 
-@dataclass
+class _DisabledTracker(QueryTracker):
+    """Shared no-op tracker returned by track_query while profiling is disabled."""
+
+    def __init__(self) -> None:
+        self.rows_returned = 0
+
+    def __enter__(self) -> "QueryTracker":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def record_rows(self, count: int) -> None:
+        """Ignore the row count."""
+
+
+_DISABLED_TRACKER = _DisabledTracker()
+
+
+@dataclass(slots=True)
 class ProfileSummary:
     """Summary statistics for all tracked queries."""
 
     queries: list[QueryStats]
 
+    # Derived in __post_init__; declared so the slotted class has room for them
+    total_queries: int = field(init=False, repr=False, compare=False)
+    total_duration_ms: float = field(init=False, repr=False, compare=False)
+    total_rows: int = field(init=False, repr=False, compare=False)
+    avg_duration_ms: float = field(init=False, repr=False, compare=False)
+    _slowest_cache: dict[int, list[QueryStats]] = field(init=False, repr=False, compare=False)
+    _table_groups: dict[str, "_QueryGroup"] = field(init=False, repr=False, compare=False)
+    _operation_groups: dict[str, "_QueryGroup"] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Calculate summary statistics."""
-        self.total_queries = len(self.queries)
-        self.total_duration_ms = sum(q.duration_ms for q in self.queries)
-        self.total_rows = sum(q.rows_returned for q in self.queries)
-        self.avg_duration_ms = (
-            self.total_duration_ms / self.total_queries if self.total_queries > 0 else 0
-        )
+        total_duration_ms = 0.0
+        total_rows = 0
+        table_groups: dict[str, _QueryGroup] = {}
+        operation_groups: dict[str, _QueryGroup] = {}
 
-        # Queries by table
-        self._queries_by_table: dict[str, list[QueryStats]] = defaultdict(list)
+        # One pass computes the overall totals and the per-table/per-operation
+        # groups with their running totals
         for q in self.queries:
+            total_duration_ms += q.duration_ms
+            total_rows += q.rows_returned
             if q.table:
-                self._queries_by_table[q.table].append(q)
-
-        # Queries by operation
-        self._queries_by_operation: dict[str, list[QueryStats]] = defaultdict(list)
-        for q in self.queries:
+                group = table_groups.get(q.table)
+                if group is None:
+                    group = table_groups[q.table] = _QueryGroup()
+                group.add(q)
             if q.operation:
-                self._queries_by_operation[q.operation].append(q)
+                group = operation_groups.get(q.operation)
+                if group is None:
+                    group = operation_groups[q.operation] = _QueryGroup()
+                group.add(q)
+
+        self.total_queries = len(self.queries)
+        self.total_duration_ms = total_duration_ms
+        self.total_rows = total_rows
+        self.avg_duration_ms = (
+            self.total_duration_ms / self.total_queries if self.total_queries > 0 else 0
+        )
+        self._slowest_cache = {}
+        self._table_groups = table_groups
+        self._operation_groups = operation_groups
 
     def get_slowest_queries(self, n: int = 10) -> list[QueryStats]:
         """Get the N slowest queries."""
-        return sorted(self.queries, key=lambda q: q.duration_ms, reverse=True)[:n]
+        slowest = self._slowest_cache.get(n)
+        if slowest is None:
+            # Same order as a full descending sort, without sorting every query
+            slowest = heapq.nlargest(n, self.queries, key=_duration_ms)
+            self._slowest_cache[n] = slowest
+        return list(slowest)
 
     def get_queries_by_table(self, table: str) -> list[QueryStats]:
         """Get all queries for a specific table."""
-        return self._queries_by_table.get(table, [])
+        group = self._table_groups.get(table)
+        return group.queries if group else []
 
     def get_table_stats(self) -> dict[str, dict[str, Any]]:
         """
@@ -196,15 +276,7 @@ class ProfileSummary:
         Returns:
             Dict mapping table names to their query statistics
         """
-        stats = {}
-        for table, queries in self._queries_by_table.items():
-            stats[table] = {
-                "query_count": len(queries),
-                "total_duration_ms": sum(q.duration_ms for q in queries),
-                "total_rows": sum(q.rows_returned for q in queries),
-                "avg_duration_ms": sum(q.duration_ms for q in queries) / len(queries),
-            }
-        return stats
+        return {table: group.stats() for table, group in self._table_groups.items()}
 
     def get_operation_stats(self) -> dict[str, dict[str, Any]]:
         """
@@ -213,15 +285,7 @@ class ProfileSummary:
         Returns:
             Dict mapping operation names to their query statistics
         """
-        stats = {}
-        for operation, queries in self._queries_by_operation.items():
-            stats[operation] = {
-                "query_count": len(queries),
-                "total_duration_ms": sum(q.duration_ms for q in queries),
-                "total_rows": sum(q.rows_returned for q in queries),
-                "avg_duration_ms": sum(q.duration_ms for q in queries) / len(queries),
-            }
-        return stats
+        return {operation: group.stats() for operation, group in self._operation_groups.items()}
 
     def format_summary(self, show_slowest: int = 5) -> str:
         """
@@ -248,7 +312,7 @@ class ProfileSummary:
         lines.append("")
 
         # Queries by operation
-        if self._queries_by_operation:
+        if self._operation_groups:
             lines.append("Queries by Operation:")
             op_stats = self.get_operation_stats()
             for op, stats in sorted(
@@ -262,7 +326,7 @@ class ProfileSummary:
             lines.append("")
 
         # Queries by table
-        if self._queries_by_table:
+        if self._table_groups:
             lines.append("Queries by Table:")
             table_stats = self.get_table_stats()
             for table, stats in sorted(
@@ -303,3 +367,27 @@ class ProfileSummary:
         lines.append("=" * 80)
 
         return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class _QueryGroup:
+    """Queries sharing a table or operation, with running totals."""
+
+    queries: list[QueryStats] = field(default_factory=list)
+    total_duration_ms: float = 0.0
+    total_rows: int = 0
+
+    def add(self, query: QueryStats) -> None:
+        """Add a query to the group and its totals."""
+        self.queries.append(query)
+        self.total_duration_ms += query.duration_ms
+        self.total_rows += query.rows_returned
+
+    def stats(self) -> dict[str, Any]:
+        """Return count, total/average duration and rows for the (non-empty) group."""
+        return {
+            "query_count": len(self.queries),
+            "total_duration_ms": self.total_duration_ms,
+            "total_rows": self.total_rows,
+            "avg_duration_ms": self.total_duration_ms / len(self.queries),
+        }
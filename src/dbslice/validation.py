@@ -5,7 +5,13 @@ reference points to a record that is included in the extraction. Distinct from
 input_validators.py, which validates user-provided CLI arguments and parameters.
 """
 
+import logging
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from io import StringIO
+from itertools import compress, repeat
+from operator import contains, is_not, itemgetter, not_
 from typing import Any
 
 from dbslice.logging import get_logger
@@ -13,8 +19,17 @@ from dbslice.models import ForeignKey, SchemaGraph
 
 logger = get_logger(__name__)
 
+# Schema-derived FK check inputs: (parent_table, fk, composite, matches_pk_width).
+# composite marks multi-column FKs; matches_pk_width is False when the FK's width
+# differs from the parent PK's, so its values can never be found in the PK index.
+_FKPlanEntry = tuple[str, ForeignKey, bool, bool]
 
-@dataclass
+# One FK to check in a table: (plan position, source columns, composite, parent PKs).
+# Parent PKs are None when no reference can match, see ExtractionValidator.validate.
+_FKCheck = tuple[int, tuple[str, ...], bool, "set[Any] | None"]
+
+
+@dataclass(slots=True)
 class OrphanedRecord:
     """Represents a record with a missing parent reference."""
 
@@ -25,21 +40,17 @@ class OrphanedRecord:
     fk_values: tuple[Any, ...]
     parent_table: str
     parent_pk_columns: tuple[str, ...]
+    pk_columns: tuple[str, ...] = ("id",)  # PK column names of table, for display
 
     def __str__(self) -> str:
         """Human-readable representation."""
-        pk_str = ", ".join(f"{col}={val}" for col, val in zip(self._get_pk_cols(), self.pk_values))
+        pk_str = ", ".join(f"{col}={val}" for col, val in zip(self.pk_columns, self.pk_values))
         fk_str = ", ".join(f"{col}={val}" for col, val in zip(self.fk_columns, self.fk_values))
         return (
             f"{self.table}({pk_str}) -> "
             f"{self.parent_table}({fk_str}) via FK '{self.fk_name}' - parent not found"
         )
 
-    def _get_pk_cols(self) -> tuple[str, ...]:
-        """Get primary key column names (used for display)."""
-        # This is a simplified version - in real usage the validator has access to schema
-        return ("id",)
-
 
 @dataclass
 class ValidationResult:
@@ -54,6 +65,7 @@ class ValidationResult:
     broken_fks: list[ForeignKey] = field(default_factory=list)
     total_records_checked: int = 0
     total_fk_checks: int = 0
+    null_fk_skips: int = 0
 
     def add_orphan(self, orphan: OrphanedRecord) -> None:
         """Add an orphaned record to the results."""
@@ -67,48 +79,48 @@ class ValidationResult:
         Returns:
             Multi-line string with validation results
         """
-        lines = []
-        lines.append("=" * 80)
-        lines.append("EXTRACTION VALIDATION REPORT")
-        lines.append("=" * 80)
-        lines.append("")
-
-        lines.append(f"Records checked: {self.total_records_checked}")
-        lines.append(f"Foreign key checks performed: {self.total_fk_checks}")
-        lines.append("")
+        # Written straight into one buffer; large reports have a line per orphan
+        report = StringIO()
+        write = report.write
+        write("=" * 80 + "\n")
+        write("EXTRACTION VALIDATION REPORT\n")
+        write("=" * 80 + "\n")
+        write("\n")
+
+        write(f"Records checked: {self.total_records_checked}\n")
+        write(f"Foreign key checks performed: {self.total_fk_checks}\n")
+        write("\n")
 
         if self.broken_fks:
-            lines.append(f"Intentionally broken FKs (for cycles): {len(self.broken_fks)}")
+            write(f"Intentionally broken FKs (for cycles): {len(self.broken_fks)}\n")
             for fk in self.broken_fks:
                 fk_desc = (
                     f"{fk.source_table}.{', '.join(fk.source_columns)} -> "
                     f"{fk.target_table}.{', '.join(fk.target_columns)}"
                 )
-                lines.append(f"  - {fk_desc} (FK: {fk.name})")
-            lines.append("")
+                write(f"  - {fk_desc} (FK: {fk.name})\n")
+            write("\n")
 
         if self.is_valid:
-            lines.append("Status: VALID")
-            lines.append("All foreign key references point to included records.")
+            write("Status: VALID\n")
+            write("All foreign key references point to included records.\n")
         else:
-            lines.append("Status: INVALID")
-            lines.append(f"Found {len(self.orphaned_records)} orphaned record(s):")
-            lines.append("")
+            write("Status: INVALID\n")
+            write(f"Found {len(self.orphaned_records)} orphaned record(s):\n")
+            write("\n")
 
-            orphans_by_table: dict[str, list[OrphanedRecord]] = {}
+            orphans_by_table: defaultdict[str, list[OrphanedRecord]] = defaultdict(list)
             for orphan in self.orphaned_records:
-                if orphan.table not in orphans_by_table:
-                    orphans_by_table[orphan.table] = []
                 orphans_by_table[orphan.table].append(orphan)
 
             for table, orphans in sorted(orphans_by_table.items()):
-                lines.append(f"Table: {table} ({len(orphans)} orphaned)")
+                write(f"Table: {table} ({len(orphans)} orphaned)\n")
                 for orphan in orphans:
-                    lines.append(f"  - {orphan}")
-                lines.append("")
+                    write(f"  - {orphan}\n")
+                write("\n")
 
-        lines.append("=" * 80)
-        return "\n".join(lines)
+        write("=" * 80)
+        return report.getvalue()
 
 
 class ExtractionValidator:
@@ -126,13 +138,26 @@ class ExtractionValidator:
         Args:
             schema: Database schema with tables and foreign keys
         """
+        self._fk_plans: dict[str, list[_FKPlanEntry]] = {}
         self.schema = schema
         logger.debug("ExtractionValidator initialized")
 
+    @property
+    def schema(self) -> SchemaGraph:
+        """Database schema the extraction is validated against."""
+        return self._schema
+
+    @schema.setter
+    def schema(self, schema: SchemaGraph) -> None:
+        """Set the schema, dropping FK plans derived from the previous one."""
+        self._schema = schema
+        self._fk_plans.clear()
+
     def validate(
         self,
         tables: dict[str, list[dict[str, Any]]],
         broken_fks: list[ForeignKey] | None = None,
+        workers: int | None = 1,
     ) -> ValidationResult:
         """
         Validate extracted data for referential integrity.
@@ -140,6 +165,8 @@ class ExtractionValidator:
         Args:
             tables: Extracted data organized by table name
             broken_fks: List of FKs that were intentionally broken for cycles
+            workers: Number of worker processes for the per-table FK checks
+                (default 1 checks in-process; None uses the CPU count)
 
         Returns:
             ValidationResult with detailed information about any issues found
@@ -153,14 +180,38 @@ class ExtractionValidator:
         result = ValidationResult(broken_fks=broken_fks or [])
         broken_fk_set = set(broken_fks) if broken_fks else set()
 
-        pk_index = self._build_pk_index(tables)
+        # Broken FKs (intentional for cycle handling) are dropped from every table's
+        # checks below, so the skip is logged once per FK rather than per row
+        for fk in dict.fromkeys(broken_fks or ()):
+            logger.debug(
+                "Skipping validation for broken FK",
+                fk_name=fk.name,
+                source_table=fk.source_table,
+                target_table=fk.target_table,
+            )
+
+        # Each table's rows are read once: the same key columns feed both the PK
+        # index and the FK checks below
+        key_columns = self._collect_key_columns(tables)
+        # Only tables some checked FK points at are ever looked up
+        target_tables = {
+            parent_table
+            for table_name in key_columns
+            for parent_table, fk, _, matches_pk_width in self._get_fk_plan(table_name)
+            if matches_pk_width and fk not in broken_fk_set
+        }
+        pk_index = self._build_pk_index(key_columns, target_tables)
         logger.debug(
             "Built PK index",
             table_count=len(pk_index),
             total_pks=sum(len(pks) for pks in pk_index.values()),
         )
 
-        # Validate each table's FK references
+        # Skip building per-orphan log context when warnings are filtered out
+        warn_orphans = logger.is_enabled_for(logging.WARNING)
+
+        # Resolve each table's FK checks: (table_name, pk_columns, fk_plan, checks)
+        table_checks: list[tuple[str, tuple[str, ...], list[_FKPlanEntry], list[_FKCheck]]] = []
         for table_name, rows in tables.items():
             table_info = self.schema.get_table(table_name)
             if not table_info:
@@ -169,58 +220,60 @@ class ExtractionValidator:
 
             result.total_records_checked += len(rows)
 
-            # Get all FKs for this table
-            parents = self.schema.get_parents(table_name)
-
-            for row in rows:
-                pk_values = self._extract_pk_values(row, table_info.primary_key)
-
-                # Check each FK relationship
-                for parent_table, fk in parents:
-                    # Skip broken FKs (intentional for cycle handling)
-                    if fk in broken_fk_set:
-                        logger.debug(
-                            "Skipping validation for broken FK",
-                            fk_name=fk.name,
-                            source_table=fk.source_table,
-                            target_table=fk.target_table,
-                        )
-                        continue
-
-                    result.total_fk_checks += 1
-
-                    # Extract FK values from the row
-                    fk_values = self._extract_fk_values(row, fk.source_columns)
-
-                    # Skip NULL FK values (nullable FKs are valid when NULL)
-                    if any(v is None for v in fk_values):
-                        logger.debug(
-                            "Skipping NULL FK value",
-                            table=table_name,
-                            fk_name=fk.name,
-                        )
-                        continue
-
-                    # Check if parent record exists in extraction
-                    if not self._has_parent_record(parent_table, fk_values, pk_index):
-                        orphan = OrphanedRecord(
-                            table=table_name,
-                            pk_values=pk_values,
-                            fk_name=fk.name,
-                            fk_columns=fk.source_columns,
-                            fk_values=fk_values,
-                            parent_table=parent_table,
-                            parent_pk_columns=fk.target_columns,
-                        )
-                        result.add_orphan(orphan)
-                        logger.warning(
-                            "Orphaned record detected",
-                            table=table_name,
-                            pk_values=pk_values,
-                            parent_table=parent_table,
-                            fk_name=fk.name,
-                            fk_values=fk_values,
-                        )
+            fk_plan = [
+                entry for entry in self._get_fk_plan(table_name) if entry[1] not in broken_fk_set
+            ]
+            result.total_fk_checks += len(rows) * len(fk_plan)
+
+            # The parent PK set is looked up once per FK. It is None when the parent
+            # has no extracted rows or its PK width differs from the FK's, which
+            # orphans every non-NULL reference.
+            checks: list[_FKCheck] = [
+                (
+                    position,
+                    fk.source_columns,
+                    composite,
+                    (pk_index.get(parent_table) or None) if matches_pk_width else None,
+                )
+                for position, (parent_table, fk, composite, matches_pk_width) in enumerate(fk_plan)
+            ]
+
+            table_checks.append((table_name, table_info.primary_key, fk_plan, checks))
+
+        outcomes = self._run_fk_checks(
+            [(key_columns[table_name], checks) for table_name, _, _, checks in table_checks],
+            workers,
+        )
+
+        for (table_name, pk_columns, fk_plan, _), (null_fk_skips, orphan_hits) in zip(
+            table_checks, outcomes
+        ):
+            result.null_fk_skips += null_fk_skips
+            columns = key_columns[table_name]
+            for row_index, position in orphan_hits:
+                parent_table, fk = fk_plan[position][:2]
+                pk_values = tuple(columns[col][row_index] for col in pk_columns)
+                fk_values = tuple(columns[col][row_index] for col in fk.source_columns)
+                orphan = OrphanedRecord(
+                    table=table_name,
+                    pk_values=pk_values,
+                    fk_name=fk.name,
+                    fk_columns=fk.source_columns,
+                    fk_values=fk_values,
+                    parent_table=parent_table,
+                    parent_pk_columns=fk.target_columns,
+                    pk_columns=pk_columns,
+                )
+                result.add_orphan(orphan)
+                if warn_orphans:
+                    logger.warning(
+                        "Orphaned record detected",
+                        table=table_name,
+                        pk_values=pk_values,
+                        parent_table=parent_table,
+                        fk_name=fk.name,
+                        fk_values=fk_values,
+                    )
 
         logger.info(
             "Validation complete",
@@ -228,93 +281,240 @@ class ExtractionValidator:
             orphaned_count=len(result.orphaned_records),
             records_checked=result.total_records_checked,
             fk_checks=result.total_fk_checks,
+            null_fk_skips=result.null_fk_skips,
         )
 
         return result
 
-    def _build_pk_index(
+    def _run_fk_checks(
+        self,
+        tasks: list[tuple[dict[str, list[Any]], list[_FKCheck]]],
+        workers: int | None,
+    ) -> list[tuple[int, list[tuple[int, int]]]]:
+        """
+        Run each table's FK checks, in-process or across worker processes.
+
+        Tables are independent once the PK index is built, so with workers other
+        than 1 and more than one table to check they are spread over a process
+        pool. Each task ships only the FK columns and parent PK sets it reads.
+
+        Args:
+            tasks: (key_columns, checks) per table
+            workers: Number of worker processes (None: CPU count, 1: in-process)
+
+        Returns:
+            (null_fk_skips, orphan_hits) per task, in task order
+        """
+        if workers == 1 or sum(1 for _, checks in tasks if checks) < 2:
+            return [_check_table(columns, checks) for columns, checks in tasks]
+
+        fk_columns = [
+            {col: columns[col] for _, source_columns, _, _ in checks for col in source_columns}
+            for columns, checks in tasks
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_check_table, fk_columns, [checks for _, checks in tasks]))
+
+        logger.debug("Checked foreign keys in parallel", table_count=len(tasks))
+        return outcomes
+
+    def _collect_key_columns(
         self,
         tables: dict[str, list[dict[str, Any]]],
-    ) -> dict[str, set[tuple[Any, ...]]]:
+    ) -> dict[str, dict[str, list[Any]]]:
         """
-        Build an index of all primary keys for fast lookup.
+        Read the PK and FK columns of every table known to the schema.
 
         Args:
             tables: Extracted data organized by table name
 
         Returns:
-            Dictionary mapping table name to set of PK tuples
+            Dictionary mapping table name to its key columns (see _key_columns)
         """
-        index: dict[str, set[tuple[Any, ...]]] = {}
+        key_columns: dict[str, dict[str, list[Any]]] = {}
 
         for table_name, rows in tables.items():
             table_info = self.schema.get_table(table_name)
             if not table_info:
                 continue
 
-            pk_columns = table_info.primary_key
-            pks = set()
+            key_columns[table_name] = self._key_columns(
+                rows, table_info.primary_key, self._get_fk_plan(table_name)
+            )
+
+        return key_columns
+
+    def _build_pk_index(
+        self,
+        key_columns: dict[str, dict[str, list[Any]]],
+        target_tables: set[str],
+    ) -> dict[str, set[Any]]:
+        """
+        Build an index of primary keys for fast lookup.
+
+        Single-column keys are stored as bare values, composite keys as tuples.
+
+        Args:
+            key_columns: Key columns per table, from _collect_key_columns
+            target_tables: Tables referenced by a checked FK; others are not indexed
 
-            for row in rows:
-                pk_tuple = self._extract_pk_values(row, pk_columns)
-                pks.add(pk_tuple)
+        Returns:
+            Dictionary mapping table name to set of PK values
+        """
+        index: dict[str, set[Any]] = {}
 
-            index[table_name] = pks
+        for table_name, columns in key_columns.items():
+            if table_name not in target_tables:
+                continue
+
+            table_info = self.schema.get_table(table_name)
+            assert table_info is not None
+
+            pk_columns = table_info.primary_key
+            if len(pk_columns) == 1:
+                index[table_name] = set(columns[pk_columns[0]])
+            else:
+                # The set constructor consumes the zipped columns without a Python-level loop
+                index[table_name] = set(zip(*(columns[col] for col in pk_columns)))
 
         return index
 
-    def _extract_pk_values(
-        self,
-        row: dict[str, Any],
-        pk_columns: tuple[str, ...],
-    ) -> tuple[Any, ...]:
+    def _get_fk_plan(self, table_name: str) -> list[_FKPlanEntry]:
         """
-        Extract primary key values from a row.
+        Get the schema-derived FK check inputs for a table, building them once.
 
         Args:
-            row: Data row dictionary
-            pk_columns: Primary key column names
+            table_name: Name of the table whose FKs are checked
 
         Returns:
-            Tuple of PK values
+            One entry per parent FK, in schema order
         """
-        return tuple(row[col] for col in pk_columns)
+        fk_plan = self._fk_plans.get(table_name)
+        if fk_plan is None:
+            fk_plan = self._fk_plans[table_name] = [
+                (
+                    parent_table,
+                    fk,
+                    len(fk.source_columns) > 1,
+                    self._matches_pk_width(parent_table, fk),
+                )
+                for parent_table, fk in self.schema.get_parents(table_name)
+            ]
+        return fk_plan
 
-    def _extract_fk_values(
-        self,
-        row: dict[str, Any],
-        fk_columns: tuple[str, ...],
-    ) -> tuple[Any, ...]:
+    def _matches_pk_width(self, parent_table: str, fk: ForeignKey) -> bool:
         """
-        Extract foreign key values from a row.
+        Check whether an FK has as many columns as its parent table's primary key.
 
         Args:
-            row: Data row dictionary
-            fk_columns: Foreign key column names
+            parent_table: Name of the parent table
+            fk: Foreign key referencing the parent
 
         Returns:
-            Tuple of FK values
+            True if FK values can be looked up in the parent's PK index
         """
-        return tuple(row.get(col) for col in fk_columns)
+        parent_info = self.schema.get_table(parent_table)
+        return parent_info is not None and len(parent_info.primary_key) == len(fk.source_columns)
 
-    def _has_parent_record(
+    def _key_columns(
         self,
-        parent_table: str,
-        fk_values: tuple[Any, ...],
-        pk_index: dict[str, set[tuple[Any, ...]]],
-    ) -> bool:
+        rows: list[dict[str, Any]],
+        pk_columns: tuple[str, ...],
+        fk_plan: list[_FKPlanEntry],
+    ) -> dict[str, list[Any]]:
         """
-        Check if parent record exists in the extraction.
+        Transpose the PK and FK columns of a table's rows into per-column lists.
+
+        PK columns must be present in every row; FK columns missing from a row
+        read as NULL.
 
         Args:
-            parent_table: Name of the parent table
-            fk_values: FK values to look up
-            pk_index: Index of all PKs in the extraction
+            rows: Data row dictionaries
+            pk_columns: Primary key column names
+            fk_plan: FK plan for the table, from _get_fk_plan
 
         Returns:
-            True if parent record exists, False otherwise
+            Dictionary mapping column name to its values, in row order
         """
-        if parent_table not in pk_index:
-            return False
+        columns = {col: list(map(itemgetter(col), rows)) for col in pk_columns}
+        for _, fk, _, _ in fk_plan:
+            for col in fk.source_columns:
+                if col not in columns:
+                    columns[col] = list(map(dict.get, rows, repeat(col)))
+        return columns
+
+
+def _check_table(
+    columns: dict[str, list[Any]],
+    checks: list[_FKCheck],
+) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Check one table's FKs over whole key columns.
+
+    Runs in worker processes too, so it only touches its arguments.
+
+    Args:
+        columns: Key columns of the table (see ExtractionValidator._key_columns)
+        checks: Non-broken FKs to check
+
+    Returns:
+        Number of NULL FK values skipped, and (row, FK plan position) pairs for
+        orphans, sorted so they are reported row by row in FK order
+    """
+    null_fk_skips = 0
+    orphan_hits: list[tuple[int, int]] = []
+    for position, source_columns, composite, parent_pks in checks:
+        fk_keys: list[Any] = (
+            list(zip(*(columns[col] for col in source_columns)))
+            if composite
+            else columns[source_columns[0]]
+        )
+
+        # NULL FK values are skipped (nullable FKs are valid when NULL);
+        # they are only counted, and reported once at the end
+        null_fk_skips += (
+            sum(map(contains, fk_keys, repeat(None))) if composite else fk_keys.count(None)
+        )
 
-        return fk_values in pk_index[parent_table]
+        orphan_hits.extend(
+            (row_index, position) for row_index in _orphan_rows(fk_keys, composite, parent_pks)
+        )
+
+    orphan_hits.sort()
+    return null_fk_skips, orphan_hits
+
+
+def _orphan_rows(
+    fk_keys: list[Any],
+    composite: bool,
+    parent_pks: set[Any] | None,
+) -> list[int]:
+    """
+    Find the rows whose FK references a parent key that was not extracted.
+
+    Args:
+        fk_keys: FK value per row; bare values for single-column FKs, tuples otherwise
+        composite: Whether fk_keys holds tuples
+        parent_pks: Indexed parent keys, or None if the parent has no extracted rows
+
+    Returns:
+        Indices of orphaned rows, ascending; rows with a NULL FK value are skipped
+    """
+    rows = range(len(fk_keys))
+    if not parent_pks:
+        # Every non-NULL key is an orphan; the NULL test is mapped in C over the column
+        if composite:
+            return list(compress(rows, map(not_, map(contains, fk_keys, repeat(None)))))
+        return list(compress(rows, map(is_not, fk_keys, repeat(None))))
+
+    # One set difference finds the distinct missing keys; rows are only scanned
+    # again when there is at least one
+    missing = set(fk_keys).difference(parent_pks)
+    if composite:
+        missing = {key for key in missing if None not in key}
+    else:
+        missing.discard(None)
+    if not missing:
+        return []
+    # compress() walks the bound membership test in C, with no per-row bytecode
+    return list(compress(rows, map(missing.__contains__, fk_keys)))
@@ -277,10 +277,11 @@ class MockAdapter(DatabaseAdapter):
 
         pk_cols = table_info.primary_key
         fk_cols = fk.source_columns
+        is_source_pk = source_pk_values.__contains__
 
         for row in self.data.get(table, []):
             pk_tuple = tuple(row[col] for col in pk_cols)
-            if pk_tuple in source_pk_values:
+            if is_source_pk(pk_tuple):
                 fk_tuple = tuple(row[col] for col in fk_cols)
                 if None not in fk_tuple:
                     result.add(fk_tuple)
@@ -300,10 +301,11 @@ class MockAdapter(DatabaseAdapter):
 
         pk_cols = table_info.primary_key
         fk_cols = fk.source_columns
+        is_target_pk = target_pk_values.__contains__
 
         for row in self.data.get(source_table, []):
             fk_tuple = tuple(row[col] for col in fk_cols)
-            if fk_tuple in target_pk_values:
+            if is_target_pk(fk_tuple):
                 pk_tuple = tuple(row[col] for col in pk_cols)
                 result.add(pk_tuple)
 
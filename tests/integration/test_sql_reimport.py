@@ -11,7 +11,13 @@ from dbslice.config import DatabaseType, SeedSpec, TraversalDirection
 from dbslice.core.engine import ExtractionEngine
 from dbslice.output.sql import SQLGenerator
 
-from .conftest import count_rows, execute_sql_file, fetch_all_rows
+from .conftest import (
+    count_rows,
+    count_tables,
+    execute_sql_file,
+    fetch_all_rows,
+    truncate_tables,
+)
 
 pytestmark = pytest.mark.integration
 
@@ -20,7 +26,7 @@ class TestSQLReimport:
     """Test that generated SQL can be re-imported successfully."""
 
     def test_reimport_basic_extraction(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test reimporting a basic extraction."""
         # Extract data
@@ -44,22 +50,21 @@ class TestSQLReimport:
         )
 
         # Clear database (TRUNCATE to keep table structure for reimport)
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         # Import SQL
         execute_sql_file(pg_connection, sql)
 
         # Verify data was imported — BOTH direction pulls in the full
         # connected component, so assert minimum expected counts
-        assert count_rows(pg_connection, "orders") >= 1
-        assert count_rows(pg_connection, "users") >= 1
-        assert count_rows(pg_connection, "order_items") >= 2
-        assert count_rows(pg_connection, "products") >= 2
+        counts = count_tables(pg_connection, ["orders", "users", "order_items", "products"])
+        assert counts["orders"] >= 1
+        assert counts["users"] >= 1
+        assert counts["order_items"] >= 2
+        assert counts["products"] >= 2
 
     def test_reimport_preserves_data(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that reimported data matches original."""
         # Extract user 1 with BOTH direction. Needs sufficient depth so the
@@ -88,9 +93,7 @@ class TestSQLReimport:
         )
 
         # Clear all tables and reimport the full extraction
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         execute_sql_file(pg_connection, sql)
 
@@ -106,7 +109,7 @@ class TestReferentialIntegrity:
     """Test that referential integrity is preserved after reimport."""
 
     def test_foreign_keys_valid(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that all foreign keys are valid after reimport."""
         # Extract order with all relationships
@@ -130,9 +133,7 @@ class TestReferentialIntegrity:
         )
 
         # Clear and reimport
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         execute_sql_file(pg_connection, sql)
 
@@ -163,7 +164,7 @@ class TestReferentialIntegrity:
             assert cur.fetchone()[0] == 0
 
     def test_insert_order_respected(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that INSERT order respects dependencies."""
         # Extract data
@@ -188,7 +189,7 @@ class TestReferentialIntegrity:
         assert orders_idx < items_idx
 
     def test_no_orphaned_records(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that reimport has no orphaned records."""
         # Extract with validation
@@ -215,9 +216,7 @@ class TestReferentialIntegrity:
             result.deferred_updates,
         )
 
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         execute_sql_file(pg_connection, sql)
 
@@ -260,7 +259,7 @@ class TestCycleResolution:
     """Test that circular references are resolved correctly on reimport."""
 
     def test_cycle_broken_fks(
-        self, circular_ref_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, circular_ref_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that broken FKs are NULL in initial INSERT."""
         # Extract with cycles
@@ -292,18 +291,19 @@ class TestCycleResolution:
         assert "UPDATE" in sql
 
         # Clear and reimport
-        with pg_connection.cursor() as cur:
-            for table in ["project_assignments", "projects", "employees", "departments"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(
+            pg_connection, ["project_assignments", "projects", "employees", "departments"]
+        )
 
         execute_sql_file(pg_connection, sql)
 
         # Verify data was imported
-        assert count_rows(pg_connection, "employees") > 0
-        assert count_rows(pg_connection, "departments") > 0
+        counts = count_tables(pg_connection, ["employees", "departments"])
+        assert counts["employees"] > 0
+        assert counts["departments"] > 0
 
     def test_deferred_updates_applied(
-        self, circular_ref_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, circular_ref_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that deferred UPDATEs restore broken FK values."""
         # Extract with cycles
@@ -333,9 +333,9 @@ class TestCycleResolution:
             result.deferred_updates,
         )
 
-        with pg_connection.cursor() as cur:
-            for table in ["project_assignments", "projects", "employees", "departments"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(
+            pg_connection, ["project_assignments", "projects", "employees", "departments"]
+        )
 
         execute_sql_file(pg_connection, sql)
 
@@ -347,7 +347,7 @@ class TestCycleResolution:
         assert dept_1["manager_id"] == original_manager_id
 
     def test_cycle_resolution_preserves_integrity(
-        self, circular_ref_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, circular_ref_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that cycle resolution doesn't break referential integrity."""
         # Extract with cycles
@@ -371,9 +371,9 @@ class TestCycleResolution:
             result.deferred_updates,
         )
 
-        with pg_connection.cursor() as cur:
-            for table in ["project_assignments", "projects", "employees", "departments"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(
+            pg_connection, ["project_assignments", "projects", "employees", "departments"]
+        )
 
         execute_sql_file(pg_connection, sql)
 
@@ -408,7 +408,7 @@ class TestAnonymizedReimport:
     """Test that anonymized data can be reimported while preserving structure."""
 
     def test_anonymized_data_reimports(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that anonymized data can be successfully reimported."""
         # Extract with anonymization
@@ -431,9 +431,7 @@ class TestAnonymizedReimport:
         )
 
         # Clear and reimport
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         execute_sql_file(pg_connection, sql)
 
@@ -447,7 +445,7 @@ class TestAnonymizedReimport:
         assert user["name"] != "Alice Smith"
 
     def test_anonymized_fks_preserved(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test that FK relationships are preserved with anonymization."""
         # Extract with anonymization
@@ -469,9 +467,7 @@ class TestAnonymizedReimport:
             schema.tables,
         )
 
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         execute_sql_file(pg_connection, sql)
 
@@ -490,7 +486,7 @@ class TestComplexReimport:
     """Test reimport of complex extraction scenarios."""
 
     def test_reimport_multiple_seeds(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test reimporting extraction from multiple seeds."""
         # Extract from multiple seeds
@@ -516,9 +512,7 @@ class TestComplexReimport:
             result.deferred_updates,
         )
 
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         execute_sql_file(pg_connection, sql)
 
@@ -528,7 +522,7 @@ class TestComplexReimport:
         assert {1, 3}.issubset(order_ids)
 
     def test_reimport_with_where_clause(
-        self, ecommerce_schema: dict, extract_config_factory, pg_connection, clean_database
+        self, ecommerce_schema: dict, extract_config_factory, pg_connection
     ):
         """Test reimporting extraction with WHERE clause seed."""
         # Extract with WHERE clause
@@ -551,9 +545,7 @@ class TestComplexReimport:
             result.deferred_updates,
         )
 
-        with pg_connection.cursor() as cur:
-            for table in ["reviews", "order_items", "orders", "products", "users"]:
-                cur.execute(f'TRUNCATE TABLE "{table}" CASCADE')
+        truncate_tables(pg_connection, ["reviews", "order_items", "orders", "products", "users"])
 
         execute_sql_file(pg_connection, sql)
 
@@ -185,6 +185,15 @@ class TestDeterministicAnonymizer:
         assert not anon.should_anonymize("orders", "id")
         assert not anon.should_anonymize("users", "id")
 
+    def test_configure_resets_cached_column_policy(self):
+        anon = DeterministicAnonymizer()
+
+        assert anon.anonymize_value("internal", "users", "metadata") == "internal"
+
+        anon.configure(["users.metadata"])
+
+        assert anon.anonymize_value("internal", "users", "metadata") != "internal"
+
     def test_redact_fields_overrides_patterns(self):
         anon = DeterministicAnonymizer()
         anon.configure(["users.custom_field"])
@@ -305,6 +314,49 @@ class TestDeterministicAnonymizer:
 
         assert set(anonymized.keys()) == set(row.keys())
 
+    def test_anonymize_rows_matches_anonymize_row(self):
+        rows = [
+            {"id": 1, "email": "a@example.com", "password": "x", "status": "active"},
+            {"id": 2, "email": None, "password": "y", "status": "inactive"},
+        ]
+
+        batch = DeterministicAnonymizer().anonymize_rows("users", rows)
+        single = [DeterministicAnonymizer().anonymize_row("users", row) for row in rows]
+
+        assert batch == single
+        assert batch[1]["email"] is None
+        assert rows[0]["email"] == "a@example.com"  # Input rows are not mutated
+
+    def test_anonymize_rows_parallel_matches_anonymize_rows(self):
+        rows = [
+            {"id": i, "email": f"user{i}@example.com", "zip": "90210", "status": "active"}
+            for i in range(7)
+        ]
+        rows[3]["email"] = None
+
+        def make_anonymizer():
+            anon = DeterministicAnonymizer(seed="parallel")
+            anon.configure([], field_providers={"users.zip": "hipaa_zip3"})
+            return anon
+
+        parallel = make_anonymizer().anonymize_rows_parallel("users", rows, chunk_size=2, workers=2)
+
+        assert parallel == make_anonymizer().anonymize_rows("users", rows)
+        assert parallel[3]["email"] is None
+
+    def test_random_int_columns_derive_value_from_hash(self):
+        anon = DeterministicAnonymizer(seed="test")
+
+        salary = anon.anonymize_value(85000, "employees", "salary")
+
+        assert isinstance(salary, int)
+        assert 0 <= salary < 10_000
+        assert (
+            DeterministicAnonymizer(seed="test").anonymize_value(85000, "employees", "salary")
+            == salary
+        )
+        assert anon.get_statistics()["cache_size"] == 0
+
     def test_cache_consistency(self):
         anon = DeterministicAnonymizer()
 
@@ -336,6 +388,27 @@ class TestDeterministicAnonymizer:
         assert stats["cache_size"] == 2
         assert stats["redact_fields_count"] == 1
 
+    def test_cache_is_bounded_and_eviction_is_deterministic(self):
+        anon = DeterministicAnonymizer(cache_size=2)
+
+        first = anon.anonymize_value("a@example.com", "users", "email")
+        anon.anonymize_value("b@example.com", "users", "email")
+        anon.anonymize_value("c@example.com", "users", "email")
+
+        assert anon.get_statistics()["cache_size"] == 2
+        # Evicted value regenerates to the same output
+        assert anon.anonymize_value("a@example.com", "users", "email") == first
+
+    def test_cache_is_sharded_per_column_and_shared_across_tables(self):
+        anon = DeterministicAnonymizer(cache_size=1)
+
+        email = anon.anonymize_value("a@example.com", "users", "email")
+        anon.anonymize_value("555-0100", "users", "phone")
+
+        # Each (column, provider) shard keeps its own most recent value
+        assert anon.get_statistics()["cache_size"] == 2
+        assert anon.anonymize_value("a@example.com", "orders", "email") == email
+
     def test_get_statistics_empty(self):
         anon = DeterministicAnonymizer()
 
@@ -529,6 +602,27 @@ class TestDeterministicAnonymizer:
         assert not anon.should_anonymize("orders", "user_id")
         assert anon.should_anonymize("orders", "email")
 
+    def test_schema_assigned_after_init_protects_foreign_keys(self):
+        """Engines attach the schema after construction; decisions made before are dropped."""
+        orders_fk = ForeignKey(
+            name="fk_orders_user",
+            source_table="orders",
+            source_columns=("user_id",),
+            target_table="users",
+            target_columns=("id",),
+            is_nullable=False,
+        )
+        schema = SchemaGraph(tables={}, edges=[orders_fk])
+        anon = DeterministicAnonymizer()
+        anon.configure(["orders.user_id"])
+
+        assert anon.anonymize_value(1, "orders", "user_id") != 1
+
+        anon.schema = schema
+
+        assert anon.schema is schema
+        assert anon.anonymize_value(1, "orders", "user_id") == 1
+
     def test_column_name_in_hash(self):
         """Hash includes column name for better determinism."""
         anon = DeterministicAnonymizer(seed="test")
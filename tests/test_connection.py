@@ -47,6 +47,21 @@ class TestParsePostgresURL:
         config = parse_database_url(url)
         assert config.password == "p@ssw0rd"
 
+    def test_query_params_follow_parse_qs_rules(self):
+        url = "postgres://localhost/mydb?a=1&a=2&blank=&flag&app=my+app%21"
+        config = parse_database_url(url)
+        assert config.options == {"a": "1", "app": "my app!"}
+
+    def test_host_is_lowercased(self):
+        config = parse_database_url("postgres://user@DB.Example.COM:6543/mydb")
+        assert config.host == "db.example.com"
+        assert config.port == 6543
+
+    def test_fragment_falls_back_to_urlparse(self):
+        config = parse_database_url("postgres://user@localhost/mydb?sslmode=require#primary")
+        assert config.database == "mydb"
+        assert config.options == {"sslmode": "require"}
+
 
 class TestParseMySQLURL:
     """Tests for MySQL URL parsing."""
@@ -1,6 +1,7 @@
 """Tests for CSV output generation."""
 
 import csv
+import gzip
 import json
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
@@ -132,6 +133,19 @@ class TestCSVGenerator:
         orders_lines = csv_output["orders"].strip().split("\n")
         assert "id,user_id,total" in orders_lines[0]
 
+    def test_per_table_row_missing_column(self, per_table_generator, sample_tables_schema):
+        tables_data = {"t": [{"a": 1, "b": 2}, {"a": 3}]}
+
+        csv_output = per_table_generator.generate(tables_data, ["t"], sample_tables_schema)
+
+        assert csv_output["t"] == "a,b\n1,2\n3,\n"
+
+    def test_per_table_row_extra_column_raises(self, per_table_generator, sample_tables_schema):
+        tables_data = {"t": [{"a": 1}, {"a": 3, "b": 2}]}
+
+        with pytest.raises(ValueError, match="fields not in fieldnames"):
+            per_table_generator.generate(tables_data, ["t"], sample_tables_schema)
+
     def test_format_value_none(self, generator):
         assert generator._format_value(None) == ""
 
@@ -192,6 +206,13 @@ class TestCSVGenerator:
         parsed = json.loads(result)
         assert parsed == [1, 2, 3, "test"]
 
+    def test_format_value_subclass_uses_isinstance_fallback(self, generator):
+        class TzDateTime(datetime):
+            pass
+
+        dt = TzDateTime(2024, 1, 15, 10, 30, 0)
+        assert generator._format_value(dt) == "2024-01-15T10:30:00"
+
     def test_format_value_nested_json(self, generator):
         data = {"users": [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]}
         result = generator._format_value(data)
@@ -199,6 +220,11 @@ class TestCSVGenerator:
         assert len(parsed["users"]) == 2
         assert parsed["users"][0]["name"] == "Alice"
 
+    def test_format_value_dict_ascii_safe(self):
+        data = {"name": "José"}
+        assert "José" in CSVGenerator()._format_value(data)
+        assert CSVGenerator(ascii_safe=True)._format_value(data) == '{"name": "Jos\\u00e9"}'
+
     def test_single_mode_preserves_insert_order(self, generator, sample_tables_schema):
         tables_data = {
             "orders": [{"id": 1, "user_id": 1, "total": 100}],
@@ -345,6 +371,33 @@ class TestCSVGenerator:
         users_content = (output_dir / "users.csv").read_text()
         assert "test@test.com" in users_content
 
+    def test_write_to_file_per_table_gzip(self, sample_tables_schema, tmp_path):
+        generator = CSVGenerator(mode="per-table", compression="gzip")
+        tables_data = {"users": [{"id": 1, "email": "test@test.com", "name": "Test"}]}
+
+        csv_output = generator.generate(tables_data, ["users"], sample_tables_schema)
+        generator.write_to_file(csv_output, tmp_path)
+
+        assert not (tmp_path / "users.csv").exists()
+        content = gzip.decompress((tmp_path / "users.csv.gz").read_bytes()).decode("utf-8")
+        assert content == csv_output["users"]
+
+    def test_write_to_file_single_zstd(self, generator, sample_tables_schema, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        generator.compression = "zstd"
+        tables_data = {"users": [{"id": 1, "email": "test@test.com", "name": "Test"}]}
+
+        csv_output = generator.generate(tables_data, ["users"], sample_tables_schema)
+        output_file = tmp_path / "output.csv.zst"
+        generator.write_to_file(csv_output, output_file)
+
+        with zstandard.open(output_file, "rt", encoding="utf-8") as f:
+            assert f.read() == csv_output
+
+    def test_init_invalid_compression(self):
+        with pytest.raises(ValueError, match="Invalid compression"):
+            CSVGenerator(compression="bz2")
+
     def test_single_mode_mixed_columns(self, generator):
         tables_data = {
             "users": [{"id": 1, "email": "a@b.com"}],
@@ -362,6 +415,17 @@ class TestCSVGenerator:
         assert "sku" in header
         assert "price" in header
 
+    def test_single_mode_columns_follow_insert_order(self, generator):
+        tables_data = {
+            "products": [{"id": 1, "sku": "ABC123", "price": 19.99}],
+            "users": [{"id": 1, "email": "a@b.com"}],
+        }
+
+        csv_output = generator.generate(tables_data, ["users", "products"], {})
+
+        header = csv_output.split("\n")[0]
+        assert header == "table_name,id,email,sku,price"
+
     def test_rfc4180_compliance(self, generator, sample_tables_schema):
         """Test RFC 4180 compliance with various edge cases."""
         tables_data = {
@@ -1,5 +1,7 @@
 """Tests for JSON output generation."""
 
+import gzip
+import io
 import json
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
@@ -91,6 +93,10 @@ class TestDatabaseTypeEncoder:
         assert parsed["bool"] is True
         assert parsed["null"] is None
 
+    def test_encode_unsupported_type_raises(self):
+        with pytest.raises(TypeError):
+            json.dumps(object(), cls=DatabaseTypeEncoder)
+
 
 class TestJSONGenerator:
     """Tests for JSONGenerator class."""
@@ -181,6 +187,19 @@ class TestJSONGenerator:
         assert len(parsed["tables"]["users"]) == 2
         assert len(parsed["tables"]["orders"]) == 2
 
+    def test_generate_single_mode_uses_row_counts(self, sample_tables_data, sample_tables_schema):
+        generator = JSONGenerator(mode="single")
+
+        result = generator.generate(
+            sample_tables_data,
+            ["users", "orders"],
+            sample_tables_schema,
+            row_counts={"users": 2, "orders": 2},
+        )
+
+        parsed = json.loads(result)
+        assert parsed["metadata"]["total_rows"] == 4
+
     def test_generate_single_mode_with_cycles(self, sample_tables_data, sample_tables_schema):
         generator = JSONGenerator(mode="single")
         insert_order = ["users", "orders"]
@@ -288,6 +307,61 @@ class TestJSONGenerator:
         assert parsed["metadata"]["total_rows"] == 0
         assert parsed["tables"] == {}
 
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_generate_to_stream_matches_generate(
+        self, sample_tables_data, sample_tables_schema, pretty
+    ):
+        generator = JSONGenerator(mode="single", pretty=pretty)
+        insert_order = ["users", "orders"]
+        stream = io.StringIO()
+
+        generator.generate_to_stream(
+            stream,
+            sample_tables_data,
+            insert_order,
+            sample_tables_schema,
+            broken_fks=[object()],
+        )
+
+        expected = json.dumps(
+            {
+                "metadata": {
+                    "generated_by": "dbslice",
+                    "table_count": 2,
+                    "total_rows": 4,
+                    "insert_order": insert_order,
+                    "has_cycles": True,
+                    "broken_fks_count": 1,
+                    "deferred_updates_count": 0,
+                },
+                "tables": sample_tables_data,
+            },
+            cls=DatabaseTypeEncoder,
+            indent=generator.indent,
+            ensure_ascii=False,
+        )
+        assert stream.getvalue() == expected
+        assert (
+            generator.generate(
+                sample_tables_data, insert_order, sample_tables_schema, broken_fks=[object()]
+            )
+            == expected
+        )
+
+    def test_generate_to_stream_empty_tables(self, sample_tables_schema):
+        generator = JSONGenerator(mode="single")
+        stream = io.StringIO()
+
+        generator.generate_to_stream(stream, {}, [], sample_tables_schema)
+
+        assert json.loads(stream.getvalue())["tables"] == {}
+
+    def test_generate_to_stream_rejects_per_table_mode(self, sample_tables_schema):
+        generator = JSONGenerator(mode="per-table")
+
+        with pytest.raises(ValueError, match="only supported in single mode"):
+            generator.generate_to_stream(io.StringIO(), {}, [], sample_tables_schema)
+
     def test_write_to_file_single_mode(self, sample_tables_data, sample_tables_schema, tmp_path):
         generator = JSONGenerator(mode="single")
         insert_order = ["users", "orders"]
@@ -328,6 +402,33 @@ class TestJSONGenerator:
         assert users_parsed["table"] == "users"
         assert users_parsed["row_count"] == 2
 
+    def test_write_to_file_single_mode_gzip(
+        self, sample_tables_data, sample_tables_schema, tmp_path
+    ):
+        generator = JSONGenerator(mode="single", compression="gzip")
+        json_output = generator.generate(
+            sample_tables_data, ["users", "orders"], sample_tables_schema
+        )
+
+        output_file = tmp_path / "output.json.gz"
+        generator.write_to_file(json_output, output_file)
+
+        assert gzip.decompress(output_file.read_bytes()).decode("utf-8") == json_output
+
+    def test_write_to_file_per_table_mode_gzip(
+        self, sample_tables_data, sample_tables_schema, tmp_path
+    ):
+        generator = JSONGenerator(mode="per-table", compression="gzip")
+        json_output = generator.generate(
+            sample_tables_data, ["users", "orders"], sample_tables_schema
+        )
+
+        generator.write_to_file(json_output, tmp_path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["orders.json.gz", "users.json.gz"]
+        parsed = json.loads(gzip.decompress((tmp_path / "users.json.gz").read_bytes()))
+        assert parsed["row_count"] == 2
+
     def test_write_to_file_creates_parent_dirs(
         self, sample_tables_data, sample_tables_schema, tmp_path
     ):
@@ -383,6 +484,17 @@ class TestJSONGenerator:
         assert parsed["tables"]["users"][0]["name"] == "Test User 中文测试"
         assert parsed["tables"]["users"][0]["emoji"] == "Hello 😀 World"
 
+    def test_ascii_safe_escapes_unicode(self, sample_tables_schema):
+        generator = JSONGenerator(mode="single", ascii_safe=True)
+
+        tables_data = {"users": [{"id": 1, "name": "Test User 中文测试"}]}
+        result = generator.generate(tables_data, ["users"], sample_tables_schema)
+
+        assert "中文测试" not in result
+        assert result.isascii()
+        parsed = json.loads(result)
+        assert parsed["tables"]["users"][0]["name"] == "Test User 中文测试"
+
     def test_null_values(self, sample_tables_schema):
         generator = JSONGenerator(mode="single")
 
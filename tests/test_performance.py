@@ -7,7 +7,7 @@ import pytest
 from dbslice.adapters.postgresql import PostgreSQLAdapter
 from dbslice.config import ExtractConfig, SeedSpec
 from dbslice.core.engine import ExtractionEngine
-from dbslice.utils.profiling import QueryProfiler
+from dbslice.utils.profiling import ProfileSummary, QueryProfiler, QueryStats
 
 
 def test_fetch_fk_values_batching(sample_schema, mock_adapter):
@@ -126,6 +126,21 @@ def test_query_profiler_slowest_queries():
     assert slowest[0].duration_ms > slowest[1].duration_ms
 
 
+def test_profile_summary_slowest_queries_keep_tie_order():
+    """Slowest queries match a stable descending sort, ties in recording order."""
+    queries = [
+        QueryStats(query=f"Q{i}", params_count=0, duration_ms=duration, rows_returned=0)
+        for i, duration in enumerate([1.0, 3.0, 2.0, 3.0, 0.5])
+    ]
+    summary = ProfileSummary(queries)
+
+    slowest = summary.get_slowest_queries(3)
+    assert [q.query for q in slowest] == ["Q1", "Q3", "Q2"]
+
+    slowest.clear()
+    assert len(summary.get_slowest_queries(3)) == 3
+
+
 def test_query_profiler_format_summary():
     """Test QueryProfiler summary formatting."""
     profiler = QueryProfiler()
@@ -181,6 +196,25 @@ def test_query_profiler_disable():
     assert len(profiler.queries) == 0
 
 
+def test_query_profiler_reenable():
+    """Re-enabling restores tracking, including via the enabled attribute."""
+    profiler = QueryProfiler()
+    profiler.enabled = False
+
+    profiler.start_query("SELECT 1", 0, "users", "fetch_rows")
+    profiler.end_query(1)
+    assert profiler.enabled is False
+    assert len(profiler.queries) == 0
+
+    profiler.enable()
+    with profiler.track_query("SELECT * FROM users", 0, "users", "fetch_rows") as tracker:
+        tracker.record_rows(5)
+
+    assert profiler.enabled is True
+    assert len(profiler.queries) == 1
+    assert profiler.queries[0].rows_returned == 5
+
+
 def test_query_profiler_reset():
     """Test that profiler can be reset."""
     profiler = QueryProfiler()
@@ -453,6 +453,79 @@ class TestOutputFileSecurity:
         finally:
             os.unlink(tmpfile)
 
+    def test_batched_output_files_keep_secure_mode(self, tmp_path):
+        """Per-table batch writes should apply the mode to every file."""
+        from dbslice.utils.fileio import write_text_files_secure
+
+        files = {tmp_path / f"table_{i}.csv": f"id\n{i}\n" for i in range(20)}
+        write_text_files_secure(files, file_mode=0o600)
+
+        for path, content in files.items():
+            assert path.read_text() == content
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    def test_compressed_output_file_keeps_secure_mode(self, tmp_path):
+        """Compressed output should get the same restrictive permissions."""
+        import gzip
+
+        from dbslice.utils.fileio import write_text_file_secure
+
+        tmpfile = tmp_path / "output.sql.gz"
+        write_text_file_secure(tmpfile, "-- test output\n", file_mode=0o600, compression="gzip")
+
+        assert stat.S_IMODE(os.stat(tmpfile).st_mode) == 0o600
+        assert gzip.decompress(tmpfile.read_bytes()) == b"-- test output\n"
+
+    def test_compressed_output_not_redirected_after_open(self, tmp_path, monkeypatch):
+        """Compression must write to the opened file, not re-resolve the path."""
+        import gzip
+
+        from dbslice.utils import fileio
+
+        victim = tmp_path / "victim.txt"
+        victim.write_text("keep me")
+        tmpfile = tmp_path / "output.sql.gz"
+        real_fchmod = os.fchmod
+
+        def swap_path_for_symlink(fd, mode):
+            # Simulate an attacker replacing the path once the file is open.
+            real_fchmod(fd, mode)
+            os.replace(tmpfile, tmp_path / "opened.sql.gz")
+            os.symlink(victim, tmpfile)
+
+        monkeypatch.setattr(fileio.os, "fchmod", swap_path_for_symlink)
+        fileio.write_text_file_secure(tmpfile, "-- test output\n", 0o600, compression="gzip")
+
+        assert victim.read_text() == "keep me"
+        opened = (tmp_path / "opened.sql.gz").read_bytes()
+        assert gzip.decompress(opened) == b"-- test output\n"
+
+    def test_compressed_output_closes_file_descriptor(self, tmp_path):
+        """Closing the compressed text stream should close the underlying file."""
+        from dbslice.utils.fileio import open_text_file_secure
+
+        f = open_text_file_secure(tmp_path / "output.sql.gz", 0o600, compression="gzip")
+        raw = f.buffer.fileobj
+        f.write("-- test output\n")
+        f.close()
+
+        assert raw.closed
+
+    def test_missing_zstandard_leaves_existing_file_untouched(self, tmp_path, monkeypatch):
+        """A missing zstd extra should fail before the output file is truncated."""
+        import sys
+
+        from dbslice.utils.fileio import write_text_file_secure
+
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        tmpfile = tmp_path / "output.sql.zst"
+        tmpfile.write_bytes(b"previous output")
+
+        with pytest.raises(ImportError, match="zstandard is required"):
+            write_text_file_secure(tmpfile, "-- test output\n", 0o600, compression="zstd")
+
+        assert tmpfile.read_bytes() == b"previous output"
+
 
 class TestYAMLDeserialization:
     """Test that YAML loading is done safely."""
@@ -312,6 +312,20 @@ class TestExtractionValidator:
         assert len(result.orphaned_records) == 2
         assert result.total_records_checked == 4
 
+    def test_parent_table_without_rows(self, simple_schema):
+        """Test that every reference to an empty or missing parent table is orphaned."""
+        validator = ExtractionValidator(simple_schema)
+        orders = [
+            {"id": 1, "user_id": 1, "total": 100.0},
+            {"id": 2, "user_id": 2, "total": 200.0},
+        ]
+
+        for tables in ({"users": [], "orders": orders}, {"orders": orders}):
+            result = validator.validate(tables)
+
+            assert [orphan.pk_values for orphan in result.orphaned_records] == [(1,), (2,)]
+            assert result.total_fk_checks == 2
+
     def test_null_fk_allowed(self, nullable_fk_schema):
         """Test that NULL FK values are allowed for nullable FKs."""
         validator = ExtractionValidator(nullable_fk_schema)
@@ -330,6 +344,20 @@ class TestExtractionValidator:
 
         assert result.is_valid is True
         assert len(result.orphaned_records) == 0
+        assert result.total_fk_checks == 2
+        assert result.null_fk_skips == 1
+
+    def test_schema_reassignment_resets_fk_plans(self, simple_schema, nullable_fk_schema):
+        """Test that FK plans cached for one schema are not reused for another."""
+        validator = ExtractionValidator(simple_schema)
+        tables = {"users": [], "orders": [{"id": 1, "user_id": 999}]}
+
+        result = validator.validate(tables)
+        assert result.orphaned_records[0].fk_name == "fk_orders_users"
+
+        validator.schema = nullable_fk_schema
+        result = validator.validate(tables)
+        assert result.orphaned_records[0].fk_name == "fk_orders_users_nullable"
 
     def test_broken_fks_skipped(self, simple_schema):
         """Test that broken FKs (for cycles) are skipped during validation."""
@@ -393,6 +421,30 @@ class TestExtractionValidator:
         assert orphan.table == "order_items"
         assert orphan.parent_table == "orders"
 
+    def test_parallel_validation_matches_serial(self, complex_schema):
+        """Test that checking tables across worker processes gives the same result."""
+        validator = ExtractionValidator(complex_schema)
+
+        tables = {
+            "users": [{"id": 1, "email": "alice@example.com"}],
+            "products": [{"id": 10, "name": "Widget"}],
+            "orders": [{"id": 100, "user_id": 1}, {"id": 101, "user_id": 2}],
+            "order_items": [
+                {"id": 1000, "order_id": 999, "product_id": 10},
+                {"id": 1001, "order_id": 100, "product_id": 11},
+            ],
+        }
+
+        serial = validator.validate(tables)
+        parallel = validator.validate(tables, workers=2)
+
+        assert parallel == serial
+        assert [(o.table, o.pk_values) for o in parallel.orphaned_records] == [
+            ("orders", (101,)),
+            ("order_items", (1000,)),
+            ("order_items", (1001,)),
+        ]
+
     def test_empty_extraction(self, simple_schema):
         """Test validation of empty extraction."""
         validator = ExtractionValidator(simple_schema)
@@ -497,3 +549,20 @@ class TestOrphanedRecord:
         assert "users" in s
         assert "fk_orders_users" in s
         assert "parent not found" in s
+
+    def test_orphaned_record_string_uses_pk_columns(self):
+        orphan = OrphanedRecord(
+            table="memberships",
+            pk_values=(1, 42),
+            fk_name="fk_memberships_users",
+            fk_columns=("user_id",),
+            fk_values=(42,),
+            parent_table="users",
+            parent_pk_columns=("id",),
+            pk_columns=("org_id", "user_id"),
+        )
+
+        assert str(orphan) == (
+            "memberships(org_id=1, user_id=42) -> users(user_id=42) "
+            "via FK 'fk_memberships_users' - parent not found"
+        )
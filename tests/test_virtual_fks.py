@@ -243,6 +243,26 @@ class TestVirtualForeignKey:
         assert fk.is_nullable == vfk.is_nullable
         assert fk.is_deferrable is False
 
+    def test_virtual_fk_to_foreign_key_is_cached(self):
+        vfk = VirtualForeignKey(
+            name="vfk_test",
+            source_table="source",
+            source_columns=("col1",),
+            target_table="target",
+            target_columns=("id",),
+            description="Test",
+        )
+
+        assert vfk.to_foreign_key() is vfk.to_foreign_key()
+        assert vfk == VirtualForeignKey(
+            name="vfk_test",
+            source_table="source",
+            source_columns=("col1",),
+            target_table="target",
+            target_columns=("id",),
+            description="Test",
+        )
+
     def test_virtual_fk_hash(self):
         vfk1 = VirtualForeignKey(
             name="vfk_test",